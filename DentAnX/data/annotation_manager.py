@@ -4,19 +4,150 @@ This module provides a class for loading, storing, and exporting per-image annot
 
 from __future__ import annotations
 
+import io
 import json
-from dataclasses import dataclass, asdict
+import mmap
+import os
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List
 import shutil
 
-from ..utils.landmarks import BBOX_CLASSES
+import numpy as np
+
+from ..utils.landmarks import BBOX_CLASSES, LANDMARK_CLASSES
+
+# Faster JSON backends are optional; fall back to the stdlib when absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import simdjson
+    # One reusable parser instance; reallocating it per document defeats the
+    # point of simdjson's internal buffer reuse.
+    _simdjson_parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+    _simdjson_parser = None
+
+
+def _json_loads(data: bytes) -> dict:
+    """Parses a JSON document from bytes with the fastest available backend."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _transform_points(px, py, cx, cy, cos_a, sin_a, w, h):
+    """Rotates landmark points into ROI space and flags those inside the ROI."""
+    dx = px - cx
+    dy = py - cy
+    rx = dx * cos_a + dy * sin_a + w / 2
+    ry = -dx * sin_a + dy * cos_a + h / 2
+    inside = (rx >= 0) & (rx <= w) & (ry >= 0) & (ry <= h)
+    return rx, ry, inside
+
+
+if njit is not None:
+    # cache=True persists the compiled kernel so repeat exports skip the JIT.
+    _transform_points = njit(cache=True)(_transform_points)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copies a file through the cheapest available kernel path.
+
+    Prefers copy_file_range (zero-copy/reflink on CoW filesystems), then
+    sendfile, then a plain copyfile. Always copies: fixed-dimension
+    images routinely differ in content at identical byte sizes, so size
+    alone cannot prove the destination is current.
+    """
+    size = os.stat(src).st_size
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fd_in = fsrc.fileno()
+            fd_out = fdst.fileno()
+            offset = 0
+            if hasattr(os, "copy_file_range"):
+                while offset < size:
+                    copied = os.copy_file_range(fd_in, fd_out, size - offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+            elif hasattr(os, "sendfile"):
+                while offset < size:
+                    sent = os.sendfile(fd_out, fd_in, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            if offset >= size:
+                return
+    except OSError:
+        pass
+    shutil.copyfile(src, dst)
+
+
+def _json_dumps(obj: object) -> bytes:
+    """Serializes an object to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _json_dumps_compact(obj: object) -> bytes:
+    """Serializes an object to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
 
 
 SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"}
 
+# Below this size the mmap setup costs more than the read it avoids.
+_MMAP_MIN_BYTES = 16 * 1024
+_SUPPORTED_EXT_NODOT = {ext.lstrip(".") for ext in SUPPORTED_EXTENSIONS}
 
-@dataclass
+_TRIAGE_POINT_CLASSES = frozenset({"CREST", "CEJ"})
+
+# Integer codes for landmark classes (0 = unknown) backing the SoA arrays on
+# AnnotationRecord, so class scans run as vectorized comparisons.
+_CLASS_TO_INT = {name: i for i, name in enumerate(LANDMARK_CLASSES, start=1)}
+
+# Unit corner offsets of an axis-aligned box, scaled by (width, height) and
+# rotated per-box when exporting oriented bounding boxes.
+_OBB_CORNER_SIGNS = np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]])
+
+# YOLO class ids skip index 0 ("Unlabeled"); BBOX_CLASSES is static, so the
+# label->id mapping and the exported class list are built once at import.
+_BBOX_CLASS_ID = {name: i - 1 for i, name in enumerate(BBOX_CLASSES)}
+_LABELED_CLASSES = [cls for cls in BBOX_CLASSES if cls != "Unlabeled"]
+
+
+def _intern_annotation_strings(points, bboxes) -> None:
+    """Interns class/label strings from parsed JSON.
+
+    Interned strings make the hot `p["class"] == "CREST"` style comparisons
+    a pointer check, and deduplicate the handful of repeated labels across
+    thousands of records.
+    """
+    for p in points:
+        cls = p.get("class")
+        if cls is not None:
+            p["class"] = sys.intern(cls)
+    for b in bboxes:
+        label = b.get("label")
+        if label is not None:
+            b["label"] = sys.intern(label)
+
+
+@dataclass(slots=True)
 class AnnotationRecord:
     """Represents a per-image annotation JSON file."""
     file_name: str
@@ -25,12 +156,37 @@ class AnnotationRecord:
     points: List[Dict[str, float | str]]
     bboxes: List[Dict[str, int | float | str]] = None
     bone_lines: List[List[Dict[str, float]]] = None  # New field
+    # SoA mirrors of `points`, derived in __post_init__; the dict list stays
+    # authoritative for JSON round-trips.
+    points_arr: np.ndarray = field(default=None, repr=False, compare=False)
+    cls_arr: np.ndarray = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         if self.bboxes is None:
             self.bboxes = []
         if self.bone_lines is None:
             self.bone_lines = []
+        if self.points_arr is None:
+            self._rebuild_point_arrays()
+
+    def _rebuild_point_arrays(self) -> None:
+        self.points_arr = np.array(
+            [(p["x"], p["y"]) for p in self.points], dtype=np.float32
+        ).reshape(-1, 2)
+        self.cls_arr = np.fromiter(
+            (_CLASS_TO_INT.get(p.get("class"), 0) for p in self.points),
+            dtype=np.int8,
+            count=len(self.points),
+        )
+
+    def set_points(self, points: List[Dict[str, float | str]]) -> None:
+        """Rebinds ``points`` and refreshes the SoA mirrors.
+
+        Callers that edit a record in place must go through here so
+        ``points_arr``/``cls_arr`` never drift from the dict list.
+        """
+        self.points = points
+        self._rebuild_point_arrays()
 
 
 class AnnotationManager:
@@ -40,6 +196,7 @@ class AnnotationManager:
         self.image_dir: Path | None = None
         self.annotation_dir: Path | None = None
         self._cache: Dict[str, AnnotationRecord] = {}
+        self._ann_path_cache: Dict[str, Path] = {}
 
     def set_image_directory(self, path: str) -> List[str]:
         """Sets the image directory and initializes the annotation directory."""
@@ -59,24 +216,35 @@ class AnnotationManager:
 
         self.annotation_dir.mkdir(parents=True, exist_ok=True)
         self._cache.clear()
+        self._ann_path_cache.clear()
         return self._scan_images()
 
     def _scan_images(self) -> List[str]:
         if self.image_dir is None:
             return []
-        files: List[str] = []
-        for candidate in self.image_dir.iterdir():
-            if candidate.is_file() and candidate.suffix.lower() in SUPPORTED_EXTENSIONS:
-                files.append(candidate.name)
-        files.sort(key=lambda n: n.lower())
+        # os.scandir reuses the directory entry's cached file type, avoiding a
+        # stat and a Path object per entry on large image directories.
+        with os.scandir(self.image_dir) as entries:
+            files = [
+                entry.name
+                for entry in entries
+                if entry.is_file() and entry.name.rpartition(".")[2].lower() in _SUPPORTED_EXT_NODOT
+            ]
+        files.sort(key=str.lower)
         return files
 
     def annotation_path(self, file_name: str) -> Path:
         """Returns the path to the annotation file for the given image file name."""
         if self.annotation_dir is None:
             raise RuntimeError("Annotation directory is not set.")
-        safe_name = file_name.replace("/", "_")
-        return self.annotation_dir / f"{Path(safe_name).stem}.json"
+        # The same file names are resolved repeatedly during a session; cache
+        # the Path so each lookup skips the replace/stem/join work.
+        path = self._ann_path_cache.get(file_name)
+        if path is None:
+            safe_name = file_name.replace("/", "_")
+            path = self.annotation_dir / f"{Path(safe_name).stem}.json"
+            self._ann_path_cache[file_name] = path
+        return path
 
     def load(self, file_name: str, width: int, height: int) -> AnnotationRecord:
         """Loads an annotation record from a JSON file."""
@@ -94,11 +262,11 @@ class AnnotationManager:
             )
             self._cache[file_name] = record
             return record
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = _json_loads(path.read_bytes())
         points = data.get("points", [])
         bboxes = data.get("bboxes", [])
         bone_lines = data.get("bone_lines", [])
+        _intern_annotation_strings(points, bboxes)
         record = AnnotationRecord(
             file_name=data.get("file_name", file_name),
             width=int(data.get("width", width)),
@@ -114,8 +282,21 @@ class AnnotationManager:
         """Saves an annotation record to a JSON file."""
         path = self.annotation_path(record.file_name)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as fh:
-            json.dump(asdict(record), fh, indent=2)
+        # Explicit dict literal: asdict walks the dataclass via reflection and
+        # deep-copies every nested list, neither of which is needed here.
+        payload = {
+            "file_name": record.file_name,
+            "width": record.width,
+            "height": record.height,
+            "points": record.points,
+            "bboxes": record.bboxes,
+            "bone_lines": record.bone_lines,
+        }
+        # Write-to-temp-then-rename: a crash mid-write leaves the previous
+        # annotation file intact instead of a truncated JSON.
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(_json_dumps(payload))
+        os.replace(tmp_path, path)
         self._cache[record.file_name] = record
 
     def export_all(self) -> Path:
@@ -124,33 +305,99 @@ class AnnotationManager:
             raise RuntimeError("Annotation directory is not set.")
         points_path = self.annotation_dir / "points.json"
         images = self._load_all_records()
-        export_payload = {"images": [asdict(img) for img in images]}
-        with points_path.open("w", encoding="utf-8") as fh:
-            json.dump(export_payload, fh, indent=2)
+        # Stream one record at a time into the array wrapper instead of
+        # materializing a second full copy of every annotation; the explicit
+        # dict literal also skips asdict's per-record field reflection.
+        with points_path.open("wb") as fh:
+            fh.write(b'{"images": [')
+            for i, record in enumerate(images):
+                if i:
+                    fh.write(b", ")
+                fh.write(_json_dumps_compact({
+                    "file_name": record.file_name,
+                    "width": record.width,
+                    "height": record.height,
+                    "points": record.points,
+                    "bboxes": record.bboxes,
+                    "bone_lines": record.bone_lines,
+                }))
+            fh.write(b"]}")
         return points_path
 
+    @staticmethod
+    def _parse_record(json_path: Path) -> AnnotationRecord:
+        # Large files are parsed straight from the page cache via mmap
+        # instead of allocating a bytes copy of the whole file first.
+        with open(json_path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if orjson is not None and size >= _MMAP_MIN_BYTES:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        data = orjson.loads(view)
+                    finally:
+                        view.release()
+            else:
+                data = _json_loads(fh.read())
+        _intern_annotation_strings(data.get("points", []), data.get("bboxes", []))
+        return AnnotationRecord(
+            file_name=data.get("file_name", json_path.stem),
+            width=int(data.get("width", 0)),
+            height=int(data.get("height", 0)),
+            points=data.get("points", []),
+            bboxes=data.get("bboxes", []),
+            bone_lines=data.get("bone_lines", []),
+        )
+
     def _load_all_records(self) -> List[AnnotationRecord]:
         if self.annotation_dir is None:
             raise RuntimeError("Annotation directory is not set.")
-        images: List[AnnotationRecord] = []
-        for json_path in sorted(self.annotation_dir.glob("*.json")):
-            if json_path.name == "points.json":
-                continue
-            with json_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            images.append(
-                AnnotationRecord(
-                    file_name=data.get("file_name", json_path.stem),
-                    width=int(data.get("width", 0)),
-                    height=int(data.get("height", 0)),
-                    points=data.get("points", []),
-                    bboxes=data.get("bboxes", []),
-                    bone_lines=data.get("bone_lines", []),
-                )
-            )
+        paths = [
+            json_path
+            for json_path in sorted(self.annotation_dir.glob("*.json"))
+            if json_path.name != "points.json"
+        ]
+        # Thousands of small JSONs are latency-bound on reads; overlap the
+        # read+parse across a thread pool instead of issuing them serially.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            images = list(ex.map(self._parse_record, paths))
         images.sort(key=lambda rec: rec.file_name.lower())
         return images
 
+    def _quick_triage(self, path: Path) -> tuple[bool, bool, bool]:
+        """Checks bbox/CREST/CEJ presence without materializing a full record.
+
+        With simdjson available this navigates the document lazily, touching
+        only the `bboxes` length and each point's `class`; otherwise it falls
+        back to a regular parse but still short-circuits the point scan.
+        """
+        raw = path.read_bytes()
+        if _simdjson_parser is not None:
+            doc = _simdjson_parser.parse(raw)
+        else:
+            doc = _json_loads(raw)
+        bboxes = doc.get("bboxes")
+        has_bbox = bboxes is not None and len(bboxes) > 0
+        has_crest = has_cej = False
+        if not has_bbox:
+            # The caller needs all three predicates to pass, so the point
+            # scan is wasted work for records without any bbox.
+            return has_bbox, has_crest, has_cej
+        points = doc.get("points")
+        if points is not None:
+            for point in points:
+                cls = point.get("class")
+                if cls not in _TRIAGE_POINT_CLASSES:
+                    continue
+                if cls == "CREST":
+                    has_crest = True
+                else:
+                    has_cej = True
+                if has_crest and has_cej:
+                    break
+        return has_bbox, has_crest, has_cej
+
     def export_datasets(self, destination: Path, val_split: float = 0.2, seed: int = 42) -> str:
         """Exports the dataset into training and validation sets."""
         if self.image_dir is None or self.annotation_dir is None:
@@ -163,10 +410,33 @@ class AnnotationManager:
         annotated_records: List[AnnotationRecord] = []
         unannotated_files: List[str] = []
 
+        # One scan of the annotation directory replaces a stat per image when
+        # checking which files carry annotations.
+        with os.scandir(self.annotation_dir) as entries:
+            ann_stems = {
+                entry.name.rpartition(".")[0]
+                for entry in entries
+                if entry.name.endswith(".json")
+            }
+
         for fname in all_files:
+            stem = fname.replace("/", "_").rpartition(".")[0] or fname
+            if stem not in ann_stems:
+                unannotated_files.append(fname)
+                continue
             ann_path = self.annotation_path(fname)
-            if ann_path.exists():
-                try:
+            try:
+                if fname in self._cache:
+                    record = self._cache[fname]
+                    has_bbox = len(record.bboxes) > 0
+                    has_crest = has_cej = False
+                    if has_bbox:
+                        has_crest = bool((record.cls_arr == _CLASS_TO_INT["CREST"]).any())
+                        has_cej = has_crest and bool((record.cls_arr == _CLASS_TO_INT["CEJ"]).any())
+                else:
+                    has_bbox, has_crest, has_cej = self._quick_triage(ann_path)
+
+                if has_bbox and has_crest and has_cej:
                     if fname in self._cache:
                         record = self._cache[fname]
                     else:
@@ -174,24 +444,17 @@ class AnnotationManager:
                         with Image.open(self.image_dir / fname) as img:
                             w, h = img.size
                         record = self.load(fname, w, h)
-
-                    has_bbox = len(record.bboxes) > 0
-                    has_crest = any(p.get("class") == "CREST" for p in record.points)
-                    has_cej = any(p.get("class") == "CEJ" for p in record.points)
-
-                    if has_bbox and has_crest and has_cej:
-                        annotated_records.append(record)
-                    else:
-                        unannotated_files.append(fname)
-                except Exception as e:
-                    print(f"Error loading {fname}: {e}")
+                    annotated_records.append(record)
+                else:
                     unannotated_files.append(fname)
-            else:
+            except Exception as e:
+                print(f"Error loading {fname}: {e}")
                 unannotated_files.append(fname)
 
         # 2. Split Annotated into Train/Val
         import random
         import math
+        from concurrent.futures import ThreadPoolExecutor
         from PIL import Image
 
         random.seed(seed)
@@ -223,70 +486,97 @@ class AnnotationManager:
 
                 # Copy Image
                 dst_img = bbox_dir / "images" / split_name / record.file_name
-                shutil.copy(src_img, dst_img)
-
-                # Generate Label
-                label_path = bbox_dir / "labels" / split_name / f"{Path(record.file_name).stem}.txt"
-                with open(label_path, "w", encoding="utf-8") as lf:
-                    for bbox in record.bboxes:
-                        # Skip unlabeled boxes
-                        label = bbox.get("label", "Unlabeled")
-                        if label == "Unlabeled":
-                            continue
-
-                        # Handle formats
-                        if "cx" in bbox:
-                            cx, cy = float(bbox["cx"]), float(bbox["cy"])
-                            w, h = float(bbox["width"]), float(bbox["height"])
-                            rotation = float(bbox.get("rotation", 0.0))
-                        else:
-                            xmin, ymin = float(bbox["xmin"]), float(bbox["ymin"])
-                            xmax, ymax = float(bbox["xmax"]), float(bbox["ymax"])
-                            cx = (xmin + xmax) / 2
-                            cy = (ymin + ymax) / 2
-                            w = xmax - xmin
-                            h = ymax - ymin
-                            rotation = 0.0
-
-                        # Normalize
-                        img_w, img_h = record.width, record.height
-
-                        # Calculate corners for OBB
-                        rad = math.radians(rotation)
-                        cos_a = math.cos(rad)
-                        sin_a = math.sin(rad)
-                        hw, hh = w / 2, h / 2
-
-                        corners_local = [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
-                        corners_global = []
-                        for dx, dy in corners_local:
-                            gx = cx + dx * cos_a - dy * sin_a
-                            gy = cy + dx * sin_a + dy * cos_a
-                            nx = max(0.0, min(1.0, gx / img_w))
-                            ny = max(0.0, min(1.0, gy / img_h))
-                            corners_global.extend([nx, ny])
-
-                        # Get class ID (skip index 0 which is "Unlabeled")
-                        try:
-                            class_id = BBOX_CLASSES.index(label) - 1  # Subtract 1 to account for Unlabeled
-                        except ValueError:
-                            class_id = 0
-
-                        lf.write(f"{class_id} " + " ".join(f"{c:.6f}" for c in corners_global) + "\n")
+                _fast_copy(src_img, dst_img)
+
+                # Gather labeled boxes as (cx, cy, w, h, rotation) rows
+                params = []
+                class_ids = []
+                for bbox in record.bboxes:
+                    # Skip unlabeled boxes
+                    label = bbox.get("label", "Unlabeled")
+                    if label == "Unlabeled":
+                        continue
+
+                    # Handle formats
+                    if "cx" in bbox:
+                        cx, cy = float(bbox["cx"]), float(bbox["cy"])
+                        w, h = float(bbox["width"]), float(bbox["height"])
+                        rotation = float(bbox.get("rotation", 0.0))
+                    else:
+                        xmin, ymin = float(bbox["xmin"]), float(bbox["ymin"])
+                        xmax, ymax = float(bbox["xmax"]), float(bbox["ymax"])
+                        cx = (xmin + xmax) / 2
+                        cy = (ymin + ymax) / 2
+                        w = xmax - xmin
+                        h = ymax - ymin
+                        rotation = 0.0
+                    params.append((cx, cy, w, h, rotation))
+
+                    # Get class ID (skip index 0 which is "Unlabeled")
+                    class_ids.append(_BBOX_CLASS_ID.get(label, 0))
+
+                # Generate Label: rotate, normalize, and clip all corners in one
+                # vectorized pass instead of per-corner Python arithmetic.
+                stem = record.file_name.rpartition(".")[0] or record.file_name
+                label_path = bbox_dir / "labels" / split_name / f"{stem}.txt"
+                if not params:
+                    label_path.write_bytes(b"")
+                else:
+                    arr = np.asarray(params, dtype=np.float64)
+                    cx, cy, w, h = arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+                    rad = np.radians(arr[:, 4])
+                    cos_a = np.cos(rad)[:, None]
+                    sin_a = np.sin(rad)[:, None]
+                    local = _OBB_CORNER_SIGNS[None, :, :] * np.stack([w, h], axis=1)[:, None, :]
+                    gx = cx[:, None] + local[:, :, 0] * cos_a - local[:, :, 1] * sin_a
+                    gy = cy[:, None] + local[:, :, 0] * sin_a + local[:, :, 1] * cos_a
+                    nx = np.clip(gx / record.width, 0.0, 1.0)
+                    ny = np.clip(gy / record.height, 0.0, 1.0)
+                    corners = np.empty((arr.shape[0], 8))
+                    corners[:, 0::2] = nx
+                    corners[:, 1::2] = ny
+                    # Serialize the whole label file in one C-level formatting
+                    # pass rather than eight format calls per box.
+                    rows = np.concatenate(
+                        [np.asarray(class_ids, dtype=np.float64)[:, None], corners], axis=1
+                    )
+                    buf = io.BytesIO()
+                    np.savetxt(buf, rows, fmt=["%d"] + ["%.6f"] * 8)
+                    label_path.write_bytes(buf.getvalue())
+
+        # Most boxes share rotation 0.0, so cache (cos, sin) per angle instead
+        # of calling libm per bbox. dict.setdefault keeps this thread-safe
+        # under the landmark export pool.
+        trig_cache: Dict[float, tuple[float, float]] = {}
 
         # Helper for Landmark Export
-        def export_landmark(records, _) -> List[dict]:
-            dataset_entries = []
-            for record in records:
-                src_img = self.image_dir / record.file_name
-                if not src_img.exists():
-                    continue
-
-                if not record.bboxes:
-                    continue
-
+        def _export_record_rois(record) -> List[dict]:
+            dataset_entries: List[dict] = []
+            src_img = self.image_dir / record.file_name
+            if src_img.exists() and record.bboxes:
+                stem = record.file_name.rpartition(".")[0] or record.file_name
                 try:
                     with Image.open(src_img) as im:
+                        # JPEG draft mode: when every ROI is small relative to
+                        # the source, ask libjpeg to decode at half resolution
+                        # (skipping DCT blocks) and scale geometry to match.
+                        scale = 1.0
+                        if src_img.suffix.lower() in {".jpg", ".jpeg"}:
+                            largest = 0.0
+                            for bbox in record.bboxes:
+                                if "cx" in bbox:
+                                    largest = max(largest, float(bbox["width"]), float(bbox["height"]))
+                                else:
+                                    largest = max(
+                                        largest,
+                                        float(bbox["xmax"]) - float(bbox["xmin"]),
+                                        float(bbox["ymax"]) - float(bbox["ymin"]),
+                                    )
+                            if 0.0 < largest < 0.5 * min(im.size):
+                                orig_width = im.width
+                                im.draft("RGB", (im.width // 2, im.height // 2))
+                                scale = im.width / orig_width
+
                         for i, bbox in enumerate(record.bboxes):
                             # Rotation/Crop Logic
                             if "cx" in bbox:
@@ -302,39 +592,59 @@ class AnnotationManager:
                                 h = ymax - ymin
                                 rotation = 0.0
 
-                            rotated_im = im.rotate(rotation, center=(cx, cy), resample=Image.Resampling.BICUBIC)
+                            # Original-resolution bbox recorded in the entry; the
+                            # working geometry follows the (possibly drafted) decode.
+                            src_bbox = {"cx": cx, "cy": cy, "width": w, "height": h, "rotation": rotation}
+                            if scale != 1.0:
+                                cx *= scale
+                                cy *= scale
+                                w *= scale
+                                h *= scale
+
+                            # Single affine transform mapping ROI pixels back to the
+                            # source: rotating the full image per bbox and cropping
+                            # afterwards touches N_bbox times more pixels.
+                            trig = trig_cache.get(rotation)
+                            if trig is None:
+                                rad = math.radians(rotation)
+                                trig = trig_cache.setdefault(rotation, (math.cos(rad), math.sin(rad)))
+                            cos_a, sin_a = trig
                             left = cx - w / 2
                             top = cy - h / 2
-                            right = cx + w / 2
-                            bottom = cy + h / 2
-
-                            roi_img = rotated_im.crop((left, top, right, bottom))
-                            roi_filename = f"{Path(record.file_name).stem}_roi_{i}.png"
+                            # Translation terms so the rotation pivots on (cx, cy)
+                            c0 = cx - (cos_a * cx - sin_a * cy)
+                            f0 = cy - (sin_a * cx + cos_a * cy)
+                            matrix = (
+                                cos_a, -sin_a, cos_a * left - sin_a * top + c0,
+                                sin_a, cos_a, sin_a * left + cos_a * top + f0,
+                            )
+                            roi_img = im.transform(
+                                (max(1, int(round(w))), max(1, int(round(h)))),
+                                Image.AFFINE,
+                                matrix,
+                                resample=Image.Resampling.BICUBIC,
+                            )
+                            roi_filename = f"{stem}_roi_{i}.png"
                             roi_path = landmark_dir / "rois" / roi_filename
                             roi_img.save(roi_path)
 
-                            # Transform Points
-                            rad = math.radians(rotation)
-                            cos_a = math.cos(rad)
-                            sin_a = math.sin(rad)
-
+                            # Transform Points: rotate the whole SoA point array
+                            # into ROI space at once (cos_a/sin_a computed above)
                             roi_points = []
-                            for pt in record.points:
-                                px, py = float(pt["x"]), float(pt["y"])
-                                dx = px - cx
-                                dy = py - cy
-                                rx_rot = dx * cos_a + dy * sin_a
-                                ry_rot = -dx * sin_a + dy * cos_a
-                                rx = rx_rot + w / 2
-                                ry = ry_rot + h / 2
-
-                                if 0 <= rx <= w and 0 <= ry <= h:
+                            pts = record.points_arr
+                            if pts.size:
+                                rx, ry, inside = _transform_points(
+                                    pts[:, 0] * scale, pts[:, 1] * scale,
+                                    cx, cy, cos_a, sin_a, w, h,
+                                )
+                                for idx in np.nonzero(inside)[0]:
+                                    pt = record.points[idx]
                                     roi_points.append({
                                         "class": pt["class"],
-                                        "x": rx,
-                                        "y": ry,
-                                        "global_x": px,
-                                        "global_y": py
+                                        "x": float(rx[idx]),
+                                        "y": float(ry[idx]),
+                                        "global_x": float(pts[idx, 0]),
+                                        "global_y": float(pts[idx, 1])
                                     })
 
                             dataset_entries.append({
@@ -343,12 +653,22 @@ class AnnotationManager:
                                 "height": h,
                                 "points": roi_points,
                                 "original_image": record.file_name,
-                                "bbox": {"cx": cx, "cy": cy, "width": w, "height": h, "rotation": rotation}
+                                "bbox": src_bbox
                             })
                 except Exception as e:
                     print(f"Error processing landmark export for {record.file_name}: {e}")
             return dataset_entries
 
+        def export_landmark(records, _) -> List[dict]:
+            # Records are independent and PIL releases the GIL in its decode,
+            # transform, and encode paths, so a thread pool scales with cores.
+            # ex.map keeps output ordered so stage2 JSONs stay deterministic.
+            dataset_entries: List[dict] = []
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+                for entries in ex.map(_export_record_rois, records):
+                    dataset_entries.extend(entries)
+            return dataset_entries
+
         # Execute Exports
         export_bbox(train_records, "train")
         export_bbox(val_records, "val")
@@ -363,7 +683,7 @@ class AnnotationManager:
             json.dump({"images": val_rois}, f, indent=2)
 
         # Create data.yaml for YOLO (exclude "Unlabeled" class)
-        labeled_classes = [cls for cls in BBOX_CLASSES if cls != "Unlabeled"]
+        labeled_classes = _LABELED_CLASSES
         yaml_content = f"""
 path: {bbox_dir.absolute()}
 train: images/train
@@ -375,10 +695,13 @@ names:
             f.write(yaml_content.strip())
 
         # 3. Export Test Images
+        # _scan_images already confirmed these files exist; _fast_copy's own
+        # stat doubles as the staleness check.
         for fname in unannotated_files:
-            src = self.image_dir / fname
-            if src.exists():
-                shutil.copy(src, test_dir / fname)
+            try:
+                _fast_copy(self.image_dir / fname, test_dir / fname)
+            except FileNotFoundError:
+                continue
 
         summary = (
             f"Export Complete:\n"
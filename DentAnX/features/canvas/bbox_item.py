@@ -2,12 +2,75 @@ from __future__ import annotations
 
 import math
 from enum import Enum
+from functools import lru_cache
 from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtSignal
-from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen, QBrush, QCursor, QPixmap
-from PyQt5.QtWidgets import QGraphicsObject, QMenu
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QBrush, QCursor, QPixmap, QStaticText
+from PyQt5.QtWidgets import (
+    QGraphicsEllipseItem,
+    QGraphicsLineItem,
+    QGraphicsObject,
+    QGraphicsRectItem,
+    QMenu,
+)
 
 from ...utils.landmarks import BBOX_COLORS
+from .canvas_style import (
+    BLACK_PEN_1,
+    WHITE_BRUSH,
+    WHITE_PEN_1,
+    YELLOW_SELECTED_BRUSH,
+    YELLOW_SELECTED_PEN,
+)
+
+
+_NORMAL_PEN_CACHE: dict = {}
+
+
+def _normal_pen(label: str, landmark_mode: bool) -> QPen:
+    """Shared border pen per (class, landmark-mode); boxes of one class
+    all reference the same pen instead of each allocating a copy."""
+    key = (label, landmark_mode)
+    pen = _NORMAL_PEN_CACHE.get(key)
+    if pen is None:
+        color = QColor(BBOX_COLORS.get(label, "#FFFF00"))
+        color.setAlpha(30 if landmark_mode else 255)
+        pen = QPen(color, 1.5)
+        _NORMAL_PEN_CACHE[key] = pen
+    return pen
+
+
+@lru_cache(maxsize=1)
+def _rotation_cursor() -> QCursor:
+    """Builds the rotate-handle cursor pixmap once per process."""
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    # C-shaped arc: white outline under a black stroke
+    painter.setPen(QPen(Qt.white, 4))
+    painter.drawArc(8, 8, 16, 16, 45 * 16, 270 * 16)
+    painter.setPen(QPen(Qt.black, 2))
+    painter.drawArc(8, 8, 16, 16, 45 * 16, 270 * 16)
+
+    # Arrowhead at the top right
+    path = QPainterPath()
+    path.moveTo(22, 6)
+    path.lineTo(22, 14)
+    path.lineTo(16, 10)
+    path.closeSubpath()
+    painter.setBrush(Qt.black)
+    painter.setPen(Qt.NoPen)
+    painter.drawPath(path)
+
+    # White border for the arrowhead
+    painter.setPen(QPen(Qt.white, 1))
+    painter.setBrush(Qt.NoBrush)
+    painter.drawPath(path)
+
+    painter.end()
+    return QCursor(pixmap)
+
 
 class Handle(Enum):
     NONE = 0
@@ -29,101 +92,11 @@ class BoundingBoxItem(QGraphicsObject):
     HANDLE_SIZE = 8.0
     MIN_SIZE = 10.0
     ROTATION_HANDLE_OFFSET = 20.0
-    _rotation_cursor: QCursor | None = None
-
-    @classmethod
-    def _get_rotation_cursor(cls) -> QCursor:
-        if cls._rotation_cursor is None:
-            pixmap = QPixmap(32, 32)
-            pixmap.fill(Qt.transparent)
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Draw curved arrow
-            pen = QPen(Qt.black, 2)
-            painter.setPen(pen)
-            
-            path = QPainterPath()
-            # Start at right side, curve up and left
-            path.moveTo(24, 16)
-            path.arcTo(8, 8, 16, 16, 0, 270)
-            painter.drawPath(path)
-            
-            # Draw arrow head at top
-            head = QPainterPath()
-            # End of arc is at (16, 24) roughly? 
-            # arcTo(x, y, w, h, startAngle, spanAngle)
-            # Rect is 8,8 to 24,24. Center 16,16.
-            # 0 degrees is 3 o'clock (24, 16).
-            # 270 degrees span goes CCW to 6 o'clock (16, 24).
-            # So arrow head should be at (16, 24) pointing left/down?
-            # Let's try a simpler icon: a circle with an arrow.
-            
-            # Let's draw a standard refresh-like arrow
-            painter.setPen(QPen(Qt.white, 3)) # Outline
-            painter.drawArc(8, 8, 16, 16, 45 * 16, 270 * 16)
-            painter.setPen(QPen(Qt.black, 1.5))
-            painter.drawArc(8, 8, 16, 16, 45 * 16, 270 * 16)
-            
-            # Arrowhead at the end (approx 315 degrees -> 45 degrees)
-            # End point is around (22, 10)
-            # Let's just draw a simple symbol
-            
-            painter.end()
-            cls._rotation_cursor = QCursor(pixmap)
-            
-            # Better approach: Use a standard bitmap if drawing is hard to get right blindly
-            # Or just a simple circle for now
-            pixmap.fill(Qt.transparent)
-            painter.begin(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # White outline
-            painter.setPen(QPen(Qt.white, 3))
-            painter.drawArc(6, 6, 20, 20, 0, 270 * 16)
-            
-            # Black stroke
-            painter.setPen(QPen(Qt.black, 1.5))
-            painter.drawArc(6, 6, 20, 20, 0, 270 * 16)
-            
-            # Arrowhead
-            # End of arc is at top (90 deg) -> 12 o'clock?
-            # Qt angles: 0 is 3 o'clock, positive is CCW.
-            # 0 to 270 goes 3 -> 12 -> 9 -> 6.
-            # End is at 6 o'clock (bottom).
-            # Let's do 90 start, 270 span.
-            # Start 90 (12 o'clock). Span 270 (CCW to 3 o'clock).
-            # End is at 3 o'clock (right).
-            
-            # Let's try a simpler "rotate" icon logic
-            # Draw a C shape
-            painter.setPen(QPen(Qt.white, 4))
-            painter.drawArc(8, 8, 16, 16, 45 * 16, 270 * 16)
-            painter.setPen(QPen(Qt.black, 2))
-            painter.drawArc(8, 8, 16, 16, 45 * 16, 270 * 16)
-            
-            # Arrowhead at top right
-            # (20, 10) roughly
-            path = QPainterPath()
-            path.moveTo(22, 6)
-            path.lineTo(22, 14)
-            path.lineTo(16, 10)
-            path.closeSubpath()
-            
-            painter.setBrush(Qt.black)
-            painter.setPen(Qt.NoPen)
-            painter.drawPath(path)
-            
-            # White border for arrowhead
-            painter.setPen(QPen(Qt.white, 1))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawPath(path)
-            
-            painter.end()
-            cls._rotation_cursor = QCursor(pixmap)
-            
-        return cls._rotation_cursor
 
+    # Shared label font; built once instead of mutating the painter's font
+    # on every repaint.
+    _LABEL_FONT = QFont()
+    _LABEL_FONT.setPointSize(8)
     def __init__(self, bbox_id: int, rect: QRectF, bounds: QRectF, rotation: float = 0.0, label: str = "Mandibular", parent=None) -> None:
         super().__init__(parent)
         self.bbox_id = bbox_id
@@ -144,24 +117,64 @@ class BoundingBoxItem(QGraphicsObject):
         
         self._selected = False
         self._landmark_mode = False  # New: track if in landmark mode
+        # Geometry caches rebuilt lazily after _rect changes; hover events
+        # otherwise allocate five QRectFs and a dict per mouse move.
+        self._handle_rects_cache: dict[Handle, QRectF] | None = None
+        self._bounding_rect_cache: QRectF | None = None
+        # QStaticText caches the glyph layout; rebuilt only when the id or
+        # label actually changes.
+        self._static_text: QStaticText | None = None
+        self._static_text_key: tuple | None = None
+        self._build_pens()
+        # Handles live as child items so hovering or dragging one only
+        # dirties its ~8x8 px region instead of repainting the whole box.
+        self._rotation_stem = QGraphicsLineItem(self)
+        self._rotation_stem.setPen(BLACK_PEN_1)
+        self._rotation_stem.setVisible(False)
+        self._handle_items: dict[Handle, QGraphicsRectItem | QGraphicsEllipseItem] = {}
+        for handle in (
+            Handle.TOP_LEFT,
+            Handle.TOP_RIGHT,
+            Handle.BOTTOM_LEFT,
+            Handle.BOTTOM_RIGHT,
+            Handle.ROTATION,
+        ):
+            child = QGraphicsEllipseItem(self) if handle == Handle.ROTATION else QGraphicsRectItem(self)
+            child.setPen(BLACK_PEN_1)
+            child.setBrush(WHITE_BRUSH)
+            # Mouse events fall through to the box, which owns the drag logic.
+            child.setAcceptedMouseButtons(Qt.NoButton)
+            child.setVisible(False)
+            self._handle_items[handle] = child
         self._dragging_handle = Handle.NONE
         self._start_pos = QPointF()
         self._start_rect = QRectF()
         self._start_rotation = 0.0
+        self._start_cos = 1.0
+        self._start_sin = 0.0
         self._start_scene_pos = QPointF()
         self._start_item_pos = QPointF()
         
         self.setZValue(5)
+        # Static (unselected) boxes render from a cached pixmap so pans and
+        # zooms over many boxes are blits, not repaints. Disabled while
+        # selected to keep handle drags sharp.
+        self.setCacheMode(QGraphicsObject.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)
         self.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
         self.setFlag(QGraphicsObject.ItemIsMovable, False)
         self.setFlag(QGraphicsObject.ItemSendsGeometryChanges, True)
 
+    def _invalidate_geometry_caches(self) -> None:
+        self._handle_rects_cache = None
+        self._bounding_rect_cache = None
+
     def boundingRect(self) -> QRectF:
         # Add padding for handles and rotation handle
-        r = self._rect
-        pad = self.HANDLE_SIZE + self.ROTATION_HANDLE_OFFSET
-        return r.adjusted(-pad, -pad, pad, pad)
+        if self._bounding_rect_cache is None:
+            pad = self.HANDLE_SIZE + self.ROTATION_HANDLE_OFFSET
+            self._bounding_rect_cache = self._rect.adjusted(-pad, -pad, pad, pad)
+        return self._bounding_rect_cache
     
     def shape(self) -> QPainterPath:
         """Return the shape for accurate hit testing with rotation."""
@@ -179,72 +192,90 @@ class BoundingBoxItem(QGraphicsObject):
         
         return path
 
+    def _build_pens(self) -> None:
+        """Rebuilds cached paint objects; paint runs every scene refresh."""
+        self._pen_selected = YELLOW_SELECTED_PEN  # Yellow border when selected
+        self._brush_selected = YELLOW_SELECTED_BRUSH  # Yellow fill with transparency
+        # Lower opacity when in landmark mode; thinner border
+        self._pen_normal = _normal_pen(self._label, self._landmark_mode)
+
     def paint(self, painter: QPainter, option, widget=None) -> None:
-        painter.setRenderHint(QPainter.Antialiasing)
-        
+        # Axis-aligned unselected boxes are pixel-aligned rectangles;
+        # antialiasing roughly doubles their fill cost for no visual gain.
+        painter.setRenderHint(
+            QPainter.Antialiasing, self._selected or self.rotation() != 0.0
+        )
+
         # Draw Box
         if self._selected:
-            pen = QPen(QColor("#FFFF00"), 1)  # Yellow border when selected
-            painter.setBrush(QBrush(QColor(255, 255, 0, 30)))  # Yellow fill with transparency
+            painter.setPen(self._pen_selected)
+            painter.setBrush(self._brush_selected)
         else:
-            # Lower opacity when in landmark mode
-            opacity = 30 if self._landmark_mode else 255
-            color = QColor(BBOX_COLORS.get(self._label, "#FFFF00"))
-            color.setAlpha(opacity)
-            pen = QPen(color, 1.5)  # Thinner border
+            painter.setPen(self._pen_normal)
             painter.setBrush(Qt.NoBrush)
-            
-        painter.setPen(pen)
         painter.drawRect(self._rect)
 
-        # Draw Handles if selected and not in landmark mode
+        # Handles are child items (see __init__); only the label remains here.
         if self._selected and not self._landmark_mode:
-            painter.setBrush(QBrush(QColor("#FFFFFF")))
-            painter.setPen(QPen(QColor("#000000"), 1))
-            
-            handles = self._get_handle_rects()
-            for handle_type, handle_rect in handles.items():
-                if handle_type == Handle.ROTATION:
-                    # Draw line to rotation handle
-                    top_center = QPointF(self._rect.center().x(), self._rect.top())
-                    painter.drawLine(top_center, handle_rect.center())
-                    # Draw circular handle
-                    painter.drawEllipse(handle_rect)
-                else:
-                    painter.drawRect(handle_rect)
-                
             # Draw ID and Label with smaller font
-            painter.setPen(QPen(QColor("#FFFFFF"), 1))
-            font = painter.font()
-            font.setPointSize(8)  # Smaller font size
-            painter.setFont(font)
-            painter.drawText(self._rect.topLeft() + QPointF(5, 12), f"{self.bbox_id}: {self._label}")
+            painter.setPen(WHITE_PEN_1)
+            painter.setFont(self._LABEL_FONT)
+            key = (self.bbox_id, self._label)
+            if self._static_text_key != key:
+                self._static_text = QStaticText(f"{self.bbox_id}: {self._label}")
+                self._static_text.prepare(painter.transform(), self._LABEL_FONT)
+                self._static_text_key = key
+            painter.drawStaticText(self._rect.topLeft() + QPointF(5, 2), self._static_text)
+
+    def set_rect(self, rect: QRectF) -> None:
+        """Update the local rectangle in place.
+
+        Lets the canvas rubberband resize one item per drag instead of
+        destroying and recreating it every mouse move.
+        """
+        if rect == self._rect:
+            return
+        self.prepareGeometryChange()
+        self._rect = QRectF(rect)
+        self._invalidate_geometry_caches()
+        if self._selected and not self._landmark_mode:
+            self._position_handle_items()
+        self.update()
 
     def set_selected(self, selected: bool) -> None:
         if self._selected != selected:
             self.prepareGeometryChange()
+            self._invalidate_geometry_caches()
             self._selected = selected
+            self.setCacheMode(
+                QGraphicsObject.NoCache if selected else QGraphicsObject.DeviceCoordinateCache
+            )
             # Bring to front when selected
             self.setZValue(10 if selected else 5)
+            self._set_handles_visible(selected and not self._landmark_mode)
             self.update()
     
     def set_landmark_mode(self, landmark_mode: bool) -> None:
         """Set whether the bbox is in landmark mode (low opacity, non-interactive)."""
         if self._landmark_mode != landmark_mode:
             self._landmark_mode = landmark_mode
+            self._build_pens()
             # Disable interactions in landmark mode
             self.setAcceptHoverEvents(not landmark_mode)
             if landmark_mode:
                 self.setAcceptedMouseButtons(Qt.NoButton)
             else:
                 self.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
+            self._set_handles_visible(self._selected and not landmark_mode)
             self.update()
 
     def _get_handle_rects(self) -> dict[Handle, QRectF]:
+        if self._handle_rects_cache is not None:
+            return self._handle_rects_cache
         r = self._rect
         s = self.HANDLE_SIZE
         hs = s / 2
-        
+
         handles = {
             Handle.TOP_LEFT: QRectF(r.left() - hs, r.top() - hs, s, s),
             Handle.TOP_RIGHT: QRectF(r.right() - hs, r.top() - hs, s, s),
@@ -255,9 +286,26 @@ class BoundingBoxItem(QGraphicsObject):
         # Rotation handle
         top_center_x = (r.left() + r.right()) / 2
         handles[Handle.ROTATION] = QRectF(top_center_x - hs, r.top() - self.ROTATION_HANDLE_OFFSET - hs, s, s)
-        
+
+        self._handle_rects_cache = handles
         return handles
 
+    def _position_handle_items(self) -> None:
+        rects = self._get_handle_rects()
+        for handle, child in self._handle_items.items():
+            child.setRect(rects[handle])
+        rot_center = rects[Handle.ROTATION].center()
+        self._rotation_stem.setLine(
+            self._rect.center().x(), self._rect.top(), rot_center.x(), rot_center.y()
+        )
+
+    def _set_handles_visible(self, visible: bool) -> None:
+        if visible:
+            self._position_handle_items()
+        self._rotation_stem.setVisible(visible)
+        for child in self._handle_items.values():
+            child.setVisible(visible)
+
     def hoverMoveEvent(self, event) -> None:
         if self._selected:
             handle = self._handle_at(event.pos())
@@ -267,7 +315,7 @@ class BoundingBoxItem(QGraphicsObject):
             elif handle in (Handle.TOP_RIGHT, Handle.BOTTOM_LEFT):
                 cursor = Qt.SizeBDiagCursor
             elif handle == Handle.ROTATION:
-                cursor = self._get_rotation_cursor()
+                cursor = _rotation_cursor()
             elif self._rect.contains(event.pos()):
                 cursor = Qt.SizeAllCursor
             self.setCursor(cursor)
@@ -292,6 +340,11 @@ class BoundingBoxItem(QGraphicsObject):
             self._start_item_pos = self.pos()
             self._start_rect = self._rect
             self._start_rotation = self.rotation()
+            # Rotation is fixed for the whole drag; hoist the trig out of
+            # the per-move resize math.
+            angle_rad = math.radians(self._start_rotation)
+            self._start_cos = math.cos(angle_rad)
+            self._start_sin = math.sin(angle_rad)
             
             if self._selected:
                 self._dragging_handle = self._handle_at(event.pos())
@@ -304,8 +357,9 @@ class BoundingBoxItem(QGraphicsObject):
 
     def mouseMoveEvent(self, event) -> None:
         if self._dragging_handle != Handle.NONE:
-            self.prepareGeometryChange()
-            
+            # prepareGeometryChange is deferred to the resize branch below:
+            # rotation and centre moves never change the local boundingRect,
+            # and calling it unconditionally forces a scene reindex per event.
             if self._dragging_handle == Handle.ROTATION:
                 # Calculate angle relative to item's position (which is its center)
                 center = self.pos()
@@ -344,9 +398,8 @@ class BoundingBoxItem(QGraphicsObject):
                 
                 # Transform mouse position from scene coords to item's local coords
                 # accounting for rotation
-                angle_rad = math.radians(self._start_rotation)
-                cos_a = math.cos(angle_rad)
-                sin_a = math.sin(angle_rad)
+                cos_a = self._start_cos
+                sin_a = self._start_sin
                 
                 # Translate mouse to item-space (relative to start position)
                 mouse_rel_x = mouse_scene.x() - self._start_item_pos.x()
@@ -381,7 +434,13 @@ class BoundingBoxItem(QGraphicsObject):
                 # Create new rect centered at origin with the new size
                 w = local_rect.width()
                 h = local_rect.height()
-                self._rect = QRectF(-w/2, -h/2, w, h)
+                new_rect = QRectF(-w/2, -h/2, w, h)
+                if new_rect != self._rect:
+                    self.prepareGeometryChange()
+                    self._rect = new_rect
+                    self._invalidate_geometry_caches()
+                    if self._selected and not self._landmark_mode:
+                        self._position_handle_items()
 
             self.update()
             event.accept()
@@ -407,15 +466,38 @@ class BoundingBoxItem(QGraphicsObject):
         super().mouseReleaseEvent(event)
 
     def _handle_at(self, pos: QPointF) -> Handle:
-        handles = self._get_handle_rects()
-        for handle, rect in handles.items():
-            if rect.contains(pos):
-                return handle
+        # The handle layout is fixed relative to _rect, so dispatch directly
+        # on position instead of five QRectF.contains calls per hover event.
+        r = self._rect
+        hs = self.HANDLE_SIZE / 2
+        px = pos.x()
+        py = pos.y()
+        left = r.left()
+        right = r.right()
+        top = r.top()
+
+        dy_top = py - top
+        if -hs <= dy_top <= hs:
+            if -hs <= px - left <= hs:
+                return Handle.TOP_LEFT
+            if -hs <= px - right <= hs:
+                return Handle.TOP_RIGHT
+        else:
+            dy_bottom = py - r.bottom()
+            if -hs <= dy_bottom <= hs:
+                if -hs <= px - left <= hs:
+                    return Handle.BOTTOM_LEFT
+                if -hs <= px - right <= hs:
+                    return Handle.BOTTOM_RIGHT
+            elif abs(py - (top - self.ROTATION_HANDLE_OFFSET)) <= hs:
+                if abs(px - (left + right) * 0.5) <= hs:
+                    return Handle.ROTATION
         return Handle.NONE
 
     def set_label(self, label: str) -> None:
         if self._label != label:
             self._label = label
+            self._build_pens()
             self.update()
             self.labelChanged.emit(self.bbox_id, label)
 
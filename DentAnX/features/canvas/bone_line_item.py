@@ -1,11 +1,54 @@
 from __future__ import annotations
 
 import math
+import struct
 from typing import List, Optional
-from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen, QBrush
+
+import numpy as np
+from PyQt5.QtCore import QByteArray, QDataStream, QPointF, QRectF, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPainterPathStroker, QPen, QBrush
 from PyQt5.QtWidgets import QGraphicsObject, QMenu
 
+from .bone_line_kernels import KERNELS_COMPILED, point_index_at as _point_index_kernel
+from .canvas_style import (
+    BLACK_PEN_1,
+    BONE_LINE_PEN,
+    BONE_LINE_SELECTED_PEN,
+    RED_BRUSH,
+    WHITE_BRUSH,
+)
+
+# Shared stroker for hit-test shapes; configured once instead of per shape() call.
+_SHAPE_STROKER = QPainterPathStroker()
+_SHAPE_STROKER.setWidth(10)
+
+
+def _polyline_path(xy: np.ndarray) -> QPainterPath:
+    """Build a QPainterPath from an (N, 2) array in one QDataStream pass.
+
+    Streams the whole vertex buffer into Qt at once instead of calling
+    moveTo/lineTo per point from Python (the arrayToQPath technique).
+    The serialized element format is (type: i32, x: f64, y: f64), big-endian,
+    prefixed by the element count and followed by the fill rule.
+    """
+    path = QPainterPath()
+    n = xy.shape[0]
+    if n == 0:
+        return path
+    # One padding record on each side holds the count header and terminator.
+    arr = np.empty(n + 2, dtype=[("x", ">f8"), ("y", ">f8"), ("c", ">i4")])
+    view = arr.view(dtype=np.uint8)
+    view[12:20] = np.frombuffer(struct.pack(">ii", n, 0), dtype=np.uint8)
+    arr[1:-1]["x"] = xy[:, 0]
+    arr[1:-1]["y"] = xy[:, 1]
+    arr[1:-1]["c"] = 1  # LineTo; the header's trailing 0 types the first MoveTo
+    last = 20 * (n + 1)
+    view[last:last + 4] = np.frombuffer(struct.pack(">i", 0), dtype=np.uint8)
+    buf = QByteArray(view[12:last + 4].tobytes())
+    QDataStream(buf) >> path
+    return path
+
+
 class BoneLineItem(QGraphicsObject):
     """
     Interactive QGraphics item representing a bone line (polyline).
@@ -15,6 +58,9 @@ class BoneLineItem(QGraphicsObject):
     # Signal emitted when the line geometry changes
     # Arguments: line_id, list of points (each point is {x, y})
     lineChanged = pyqtSignal(str, list)
+    # Lightweight per-move feedback during a vertex drag; the full point
+    # list only goes out via lineChanged on release.
+    pointDragged = pyqtSignal(str, int, float, float)
     deleteRequested = pyqtSignal(str)
     selected = pyqtSignal(str)
 
@@ -25,114 +71,147 @@ class BoneLineItem(QGraphicsObject):
         self.line_id = line_id
         # Convert list of points to local QPointF list
         self._points: List[QPointF] = [QPointF(p.x(), p.y()) for p in points]
+        # SoA mirror of the vertex list for vectorized bounding-rect and
+        # hit-test work on long polylines.
+        self._points_xy: np.ndarray = np.empty((0, 2), dtype=np.float32)
+        self._cached_path: Optional[QPainterPath] = None
+        self._shape_cache: Optional[QPainterPath] = None
+        self._rebuild_points_xy()
         self._image_rect = image_rect
+        # Plain-float bounds so the drag clamp doesn't call into Qt per move.
+        self._image_bounds = (
+            image_rect.left(),
+            image_rect.top(),
+            image_rect.right(),
+            image_rect.bottom(),
+        )
         
         self._selected = False
         self._hover_point_index: int = -1
         self._dragging_point_index: int = -1
         
         self.setZValue(6)  # Just above bboxes (5)
+        # Static (unselected) lines render from a cached pixmap; disabled
+        # while selected so live vertex drags stay sharp.
+        self.setCacheMode(QGraphicsObject.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)
         self.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
         self.setFlag(QGraphicsObject.ItemIsMovable, False)
         self.setFlag(QGraphicsObject.ItemSendsGeometryChanges, True)
 
+    def _rebuild_points_xy(self) -> None:
+        self._points_xy = np.array(
+            [(p.x(), p.y()) for p in self._points], dtype=np.float32
+        ).reshape(-1, 2)
+        self._cached_path = None
+        self._shape_cache = None
+
+    def _line_path(self) -> QPainterPath:
+        if self._cached_path is None:
+            self._cached_path = _polyline_path(self._points_xy)
+        return self._cached_path
+
     def boundingRect(self) -> QRectF:
         if not self._points:
             return QRectF()
-        
-        # Calculate bounding rect of all points
-        x_min = min(p.x() for p in self._points)
-        y_min = min(p.y() for p in self._points)
-        x_max = max(p.x() for p in self._points)
-        y_max = max(p.y() for p in self._points)
-        
-        w = x_max - x_min
-        h = y_max - y_min
-        
+
+        # Calculate bounding rect of all points in one vectorized pass
+        x_min, y_min = self._points_xy.min(axis=0)
+        x_max, y_max = self._points_xy.max(axis=0)
+
         # Add padding for handles
         pad = self.HANDLE_SIZE
-        return QRectF(x_min, y_min, w, h).adjusted(-pad, -pad, pad, pad)
+        return QRectF(
+            float(x_min), float(y_min), float(x_max - x_min), float(y_max - y_min)
+        ).adjusted(-pad, -pad, pad, pad)
 
     def shape(self) -> QPainterPath:
-        path = QPainterPath()
+        # The scene calls shape() on every mouse event; re-stroking the
+        # polyline each time is wasteful, so cache until geometry or
+        # selection changes.
+        if self._shape_cache is not None:
+            return self._shape_cache
+
         if not self._points:
-            return path
-            
-        # Add lines with some thickness for hit testing
-        stroker = QPainterPath()
-        stroker.moveTo(self._points[0])
-        for p in self._points[1:]:
-            stroker.lineTo(p)
-            
+            return QPainterPath()
+
         # Create a wider path for easy clicking
-        from PyQt5.QtGui import QPainterPathStroker
-        ps = QPainterPathStroker()
-        ps.setWidth(10)
-        path = ps.createStroke(stroker)
-        
+        path = _SHAPE_STROKER.createStroke(self._line_path())
+
         # Add handles explicitly if selected
         if self._selected:
             for p in self._points:
-                r = QRectF(p.x() - self.HANDLE_SIZE/2, p.y() - self.HANDLE_SIZE/2, 
+                r = QRectF(p.x() - self.HANDLE_SIZE/2, p.y() - self.HANDLE_SIZE/2,
                            self.HANDLE_SIZE, self.HANDLE_SIZE)
                 path.addRect(r)
-                
+
+        self._shape_cache = path
         return path
 
     def paint(self, painter: QPainter, option, widget=None) -> None:
-        painter.setRenderHint(QPainter.Antialiasing)
-        
+        # Idle lines skip antialiasing; it only pays off while the line is
+        # selected or a vertex is highlighted.
+        painter.setRenderHint(
+            QPainter.Antialiasing, self._selected or self._hover_point_index != -1
+        )
+
         if not self._points:
             return
 
         # Draw Line
-        color = QColor("#00FF00")  # Green for bone lines
-        width = 2.0
-        if self._selected:
-            color = QColor("#FFFF00")  # Yellow when selected
-            width = 3.0
-            
-        pen = QPen(color, width)
-        painter.setPen(pen)
+        painter.setPen(BONE_LINE_SELECTED_PEN if self._selected else BONE_LINE_PEN)
         painter.setBrush(Qt.NoBrush)
         
-        path = QPainterPath()
-        path.moveTo(self._points[0])
-        for p in self._points[1:]:
-            path.lineTo(p)
-        painter.drawPath(path)
+        painter.drawPath(self._line_path())
 
         # Draw Handles (Points)
         # Always draw start and end points slightly different?
         # Or just draw all points when selected/hovered.
         
         draw_handles = self._selected or self._hover_point_index != -1
-        
+
         if draw_handles:
+            # Batch the brush state: all normal handles with one white brush,
+            # then the 0-2 highlighted ones in red, instead of switching
+            # pen/brush per handle.
+            hover = self._hover_point_index
+            dragging = self._dragging_point_index
+            painter.setPen(BLACK_PEN_1)
+            painter.setBrush(WHITE_BRUSH)
+            size = self.HANDLE_SIZE
+            half = size / 2
             for i, p in enumerate(self._points):
-                # Highlight hovered point
-                if i == self._hover_point_index or i == self._dragging_point_index:
-                    painter.setBrush(QBrush(QColor("#FF0000"))) # Red
-                    size = self.HANDLE_SIZE + 2
-                else:
-                    painter.setBrush(QBrush(QColor("#FFFFFF"))) # White
-                    size = self.HANDLE_SIZE
-                
-                painter.setPen(QPen(QColor("#000000"), 1))
-                r = QRectF(p.x() - size/2, p.y() - size/2, size, size)
-                painter.drawEllipse(r)
+                if i == hover or i == dragging:
+                    continue
+                painter.drawEllipse(QRectF(p.x() - half, p.y() - half, size, size))
+
+            if hover != -1 or dragging != -1:
+                painter.setBrush(RED_BRUSH)
+                size = self.HANDLE_SIZE + 2
+                half = size / 2
+                for i in {hover, dragging}:
+                    if i == -1:
+                        continue
+                    p = self._points[i]
+                    painter.drawEllipse(QRectF(p.x() - half, p.y() - half, size, size))
 
     def set_selected(self, selected: bool) -> None:
         if self._selected != selected:
             self.prepareGeometryChange()
             self._selected = selected
+            self._shape_cache = None
+            self.setCacheMode(
+                QGraphicsObject.NoCache
+                if selected
+                else QGraphicsObject.DeviceCoordinateCache
+            )
             self.setZValue(11 if selected else 6)
             self.update()
 
     def add_point(self, pos: QPointF) -> None:
         self.prepareGeometryChange()
         self._points.append(pos)
+        self._rebuild_points_xy()
         self.update()
         self._emit_changed()
 
@@ -141,25 +220,61 @@ class BoneLineItem(QGraphicsObject):
             return
         self.prepareGeometryChange()
         self._points[-1] = pos
+        self._points_xy[-1] = (pos.x(), pos.y())
+        self._cached_path = None
+        self._shape_cache = None
         self.update()
         self._emit_changed()
 
+    def set_image_rect(self, image_rect: QRectF) -> None:
+        self._image_rect = image_rect
+        self._image_bounds = (
+            image_rect.left(),
+            image_rect.top(),
+            image_rect.right(),
+            image_rect.bottom(),
+        )
+
     def get_points(self) -> List[dict]:
         return [{"x": p.x(), "y": p.y()} for p in self._points]
 
     def set_points(self, points: List[QPointF]) -> None:
         self.prepareGeometryChange()
         self._points = points
+        self._rebuild_points_xy()
         self.update()
 
     def _emit_changed(self) -> None:
         self.lineChanged.emit(self.line_id, self.get_points())
 
     def _point_index_at(self, pos: QPointF) -> int:
+        # Squared distance with a cheap axis reject: skips the sqrt and the
+        # multiplies for the vast majority of vertices on every hover move.
+        r = self.HANDLE_SIZE
+        r2 = r * r
+        x = pos.x()
+        y = pos.y()
+        if KERNELS_COMPILED and self._points:
+            return int(_point_index_kernel(self._points_xy, x, y, r2))
+        if len(self._points) > 32:
+            # Long polylines: vectorized Chebyshev filter over the SoA mirror,
+            # then exact check only on the survivors.
+            near = np.abs(self._points_xy - (x, y)).max(axis=1) < r
+            for i in np.nonzero(near)[0]:
+                p = self._points[i]
+                dx = p.x() - x
+                dy = p.y() - y
+                if dx * dx + dy * dy < r2:
+                    return int(i)
+            return -1
         for i, p in enumerate(self._points):
-            # Check distance
-            dist = math.hypot(p.x() - pos.x(), p.y() - pos.y())
-            if dist < self.HANDLE_SIZE:
+            dx = p.x() - x
+            if dx > r or dx < -r:
+                continue
+            dy = p.y() - y
+            if dy > r or dy < -r:
+                continue
+            if dx * dx + dy * dy < r2:
                 return i
         return -1
 
@@ -191,6 +306,7 @@ class BoneLineItem(QGraphicsObject):
             idx = self._point_index_at(event.pos())
             if idx != -1:
                 self._dragging_point_index = idx
+                self.setCacheMode(QGraphicsObject.NoCache)
                 event.accept()
                 return
                 
@@ -209,23 +325,34 @@ class BoneLineItem(QGraphicsObject):
             # Dragging a specific point
             new_pos = event.pos()
             # Clamp to bounds
-            x = max(self._image_rect.left(), min(self._image_rect.right(), new_pos.x()))
-            y = max(self._image_rect.top(), min(self._image_rect.bottom(), new_pos.y()))
+            left, top, right, bottom = self._image_bounds
+            x = new_pos.x()
+            y = new_pos.y()
+            x = left if x < left else right if x > right else x
+            y = top if y < top else bottom if y > bottom else y
             new_pos = QPointF(x, y)
             
             self.prepareGeometryChange()
             self._points[self._dragging_point_index] = new_pos
+            self._points_xy[self._dragging_point_index] = (new_pos.x(), new_pos.y())
+            self._cached_path = None
+            self._shape_cache = None
             self.update()
-            self._emit_changed()
+            # Emitting lineChanged here would rebuild the whole dict list on
+            # every pixel of drag; defer that to mouseReleaseEvent.
+            self.pointDragged.emit(self.line_id, self._dragging_point_index, x, y)
             event.accept()
             return
-            
+
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event) -> None:
         if self._dragging_point_index != -1:
             self._dragging_point_index = -1
+            if not self._selected:
+                self.setCacheMode(QGraphicsObject.DeviceCoordinateCache)
             self.update()
+            self._emit_changed()
             event.accept()
             return
         super().mouseReleaseEvent(event)
@@ -247,6 +374,7 @@ class BoneLineItem(QGraphicsObject):
         elif delete_point_action and action == delete_point_action:
             self.prepareGeometryChange()
             self._points.pop(idx)
+            self._rebuild_points_xy()
             self.update()
             self._emit_changed()
             
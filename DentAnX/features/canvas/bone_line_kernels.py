@@ -0,0 +1,51 @@
+"""Compiled hot-loop kernels for bone-line hit testing.
+
+Numba is optional: when it is installed the kernels are jitted (and
+warmed up at import so the first hover doesn't pay the compile cost);
+otherwise the pure-Python definitions are used as-is and the caller's
+vectorized fallbacks remain the fast path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+def point_index_at(xy: np.ndarray, x: float, y: float, r2: float) -> int:
+    """Index of the first vertex within sqrt(r2) of (x, y), or -1."""
+    for i in range(xy.shape[0]):
+        dx = xy[i, 0] - x
+        dy = xy[i, 1] - y
+        if dx * dx + dy * dy < r2:
+            return i
+    return -1
+
+
+def clamp_point(x: float, y: float, left: float, top: float, right: float, bottom: float) -> tuple:
+    """Clamp (x, y) into the rectangle [left, right] x [top, bottom]."""
+    if x < left:
+        x = left
+    elif x > right:
+        x = right
+    if y < top:
+        y = top
+    elif y > bottom:
+        y = bottom
+    return x, y
+
+
+KERNELS_COMPILED = njit is not None
+
+if KERNELS_COMPILED:
+    point_index_at = njit(cache=True)(point_index_at)
+    clamp_point = njit(cache=True)(clamp_point)
+    # Warm up so the first hover event doesn't trigger compilation.
+    _warmup = np.zeros((1, 2), dtype=np.float32)
+    point_index_at(_warmup, 0.0, 0.0, 1.0)
+    clamp_point(0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
+    del _warmup
@@ -0,0 +1,26 @@
+"""Shared QPen/QBrush palette for canvas items.
+
+The items never mutate these, so one module-level instance serves every
+box and line on the scene instead of allocating fresh Qt paint objects
+inside paint() at event rate.
+"""
+
+from __future__ import annotations
+
+# pylint: disable=no-name-in-module
+from PyQt5.QtGui import QBrush, QColor, QPen
+# pylint: enable=no-name-in-module
+
+WHITE_BRUSH = QBrush(QColor("#FFFFFF"))
+RED_BRUSH = QBrush(QColor("#FF0000"))
+
+BLACK_PEN_1 = QPen(QColor("#000000"), 1)
+WHITE_PEN_1 = QPen(QColor("#FFFFFF"), 1)
+
+# Selection highlight shared by boxes and lines
+YELLOW_SELECTED_PEN = QPen(QColor("#FFFF00"), 1)
+YELLOW_SELECTED_BRUSH = QBrush(QColor(255, 255, 0, 30))
+
+# Bone-line strokes
+BONE_LINE_PEN = QPen(QColor("#00FF00"), 2.0)
+BONE_LINE_SELECTED_PEN = QPen(QColor("#FFFF00"), 3.0)
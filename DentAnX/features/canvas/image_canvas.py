@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
 from enum import Enum, auto
 from typing import Dict, List
 
 import math
 import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+    prange = range
+
+try:
+    import cupy as cp
+except ImportError:  # pragma: no cover - cupy is an optional accelerator
+    cp = None
 # pylint: disable=no-name-in-module
-from PyQt5.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QCursor, QImage, QPixmap, QPainter, QPen, QTransform
+from PyQt5.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QCursor, QImage, QPixmap, QPainter, QPen, QPolygonF, QTransform
 from PyQt5.QtWidgets import (
     QGestureEvent,
+    QGraphicsItem,
     QGraphicsLineItem,
     QGraphicsPixmapItem,
     QGraphicsPolygonItem,
@@ -21,10 +34,80 @@ from PyQt5.QtWidgets import (
 )
 # pylint: enable=no-name-in-module
 
-from ...utils.landmarks import LANDMARK_COLORS, normalize_class, BBOX_CLASSES
-from .point_item import LandmarkPointItem
+from ...utils.landmarks import normalize_class, BBOX_CLASSES
+from .point_item import LandmarkPointItem, PointsOverlay, class_color
 from .bbox_item import BoundingBoxItem
 from .bone_line_item import BoneLineItem
+from .spatial_index import CanvasSpatialIndex
+
+
+def _apply_tone(src: np.ndarray, dst: np.ndarray, brightness: float, contrast: float, inv_gamma: float) -> None:
+    """Fused brightness/contrast/gamma pass: one streaming loop, no temporaries.
+
+    The chained NumPy version walks the whole image once per operation;
+    this keeps each pixel in registers through the full tone curve and
+    writes straight into the preallocated destination. Alpha is copied
+    through untouched.
+    """
+    height = src.shape[0]
+    width = src.shape[1]
+    scale = 1.0 + contrast / 100.0
+    for i in prange(height):  # pylint: disable=not-an-iterable
+        for j in range(width):
+            for k in range(3):
+                v = src[i, j, k] * scale + brightness
+                if v < 0.0:
+                    v = 0.0
+                elif v > 255.0:
+                    v = 255.0
+                v = 255.0 * (v / 255.0) ** inv_gamma
+                if v > 255.0:
+                    v = 255.0
+                dst[i, j, k] = np.uint8(v)
+            dst[i, j, 3] = src[i, j, 3]
+
+
+def _edge_enhance_stencil(src: np.ndarray, dst: np.ndarray) -> None:
+    """Laplacian sharpen with reflected edges in one streaming pass.
+
+    The padded-slice version materializes the pad plus four shifted
+    copies; here each pixel is read once, the reflect boundary is a pair
+    of index clamps, and the saturated result goes straight into dst.
+    """
+    height = src.shape[0]
+    width = src.shape[1]
+    for i in prange(height):  # pylint: disable=not-an-iterable
+        up = i - 1 if i > 0 else 1
+        down = i + 1 if i < height - 1 else height - 2
+        for j in range(width):
+            left = j - 1 if j > 0 else 1
+            right = j + 1 if j < width - 1 else width - 2
+            for k in range(3):
+                c = src[i, j, k]
+                laplacian = 4.0 * c - (
+                    src[up, j, k] + src[down, j, k] + src[i, left, k] + src[i, right, k]
+                )
+                v = c + 0.3 * laplacian
+                if v < 0.0:
+                    v = 0.0
+                elif v > 255.0:
+                    v = 255.0
+                dst[i, j, k] = v
+
+
+_TONE_KERNEL_COMPILED = njit is not None
+_EDGE_KERNEL_COMPILED = njit is not None
+
+if _TONE_KERNEL_COMPILED:
+    _apply_tone = njit(parallel=True, fastmath=True, cache=True)(_apply_tone)
+
+if _EDGE_KERNEL_COMPILED:
+    _edge_enhance_stencil = njit(parallel=True, fastmath=True, cache=True)(_edge_enhance_stencil)
+    # Warm the JIT at import so the first toggle of edge enhance does not
+    # stall on compilation.
+    _edge_enhance_stencil(
+        np.zeros((4, 4, 3), dtype=np.float32), np.empty((4, 4, 3), dtype=np.float32)
+    )
 
 
 class CanvasMode(Enum):
@@ -51,8 +134,12 @@ class ImageCanvas(QGraphicsView):
 
     def __init__(self) -> None:
         super().__init__()
-        self.setRenderHint(QPainter.Antialiasing)
+        # No view-global antialiasing: every overlay item sets its own AA
+        # hint in paint(), so the view only keeps pixmap smoothing and the
+        # rasterizer skips the AA bookkeeping for exposed regions.
         self.setRenderHint(QPainter.SmoothPixmapTransform)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
         self.setFrameShape(QGraphicsView.NoFrame)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
@@ -67,12 +154,29 @@ class ImageCanvas(QGraphicsView):
         self._scene.setSceneRect(0, 0, 0, 0)
 
         self._point_items: Dict[str, LandmarkPointItem] = {}
-        self._points: Dict[str, Dict[str, float | str]] = {}
+        # Point state lives in structure-of-arrays form: coordinates in one
+        # float32 block plus parallel class/radius/id sequences, with an
+        # id -> index map for O(1) lookup. A drag then updates one array row
+        # instead of rewriting dict entries, and serialization vectorizes
+        # over the coordinate block directly.
+        self._point_id_to_idx: Dict[str, int] = {}
+        self._point_ids: List[str] = []
+        self._point_xy = np.empty((0, 2), dtype=np.float32)
+        self._point_cls: List[str] = []
+        self._point_radii: List[float] = []
+        self._point_count = 0
+        # Incremental per-class tally so countsChanged never rescans the
+        # class list.
+        self._class_counts: Dict[str, int] = defaultdict(int)
         
         self._bbox_items: Dict[int, BoundingBoxItem] = {}
         self._bboxes: Dict[int, Dict[str, int | float | str]] = {}
         self._next_bbox_id = 0
 
+        # Grid index over bbox/line bounds so point hit-tests don't walk
+        # every item on the scene.
+        self._spatial_index = CanvasSpatialIndex()
+
         self._bone_line_items: Dict[str, BoneLineItem] = {}
         # Storage format: {id: [ {x, y}, ... ]}
         self._bone_lines: Dict[str, List[Dict[str, float]]] = {}
@@ -82,6 +186,9 @@ class ImageCanvas(QGraphicsView):
         self._current_bone_line_item: BoneLineItem | None = None
         
         self._image_rect = QRectF()
+        # Image bounds mirrored as plain floats so per-event clamps avoid
+        # four QRectF accessor calls; kept in sync with _image_rect.
+        self._image_bounds: tuple[float, float, float, float] | None = None
         self._selected_point_id: str | None = None
         self._selected_bbox_id: int | None = None
         
@@ -93,19 +200,113 @@ class ImageCanvas(QGraphicsView):
         
         # Three-point drawing mode
         self._bbox_draw_mode = BBoxDrawMode.DRAG
+        # Precomputed mode flag checked per processed mouse move.
+        self._three_point_active = False
         self._three_point_corners: List[QPointF] = []
-        self._preview_line: QGraphicsLineItem | None = None
-        self._preview_polygon: QGraphicsPolygonItem | None = None
+        # (int x, int y, corner count) of the last built preview; moves
+        # within the same source pixel skip the geometry rebuild.
+        self._three_point_preview_key: tuple | None = None
+        # Preview items are created once and toggled with setVisible();
+        # removing/re-adding scene items per mouse move churns the BSP index.
+        preview_pen = QPen(QColor(255, 255, 0), 2, Qt.DashLine)
+        self._preview_line = QGraphicsLineItem()
+        self._preview_line.setPen(preview_pen)
+        self._preview_line.setZValue(10)
+        self._preview_line.setVisible(False)
+        self._scene.addItem(self._preview_line)
+        self._preview_polygon = QGraphicsPolygonItem()
+        self._preview_polygon.setPen(preview_pen)
+        self._preview_polygon.setBrush(QBrush(QColor(255, 255, 0, 50)))
+        self._preview_polygon.setZValue(10)
+        self._preview_polygon.setVisible(False)
+        self._scene.addItem(self._preview_polygon)
+        # Batched read-only rendering of all landmark points for bbox/bone
+        # modes; see PointsOverlay.
+        self._points_overlay = PointsOverlay()
+        self._scene.addItem(self._points_overlay)
 
         self._zoom_percent = 100
         self._zoom_factor = 1.0
         self._base_scale = 1.0
         self._base_transform = QTransform()
         self._original_np: np.ndarray | None = None
+        # Owns the pixel buffer that _original_np views zero-copy.
+        self._qimage_owner: QImage | None = None
         self._display_qimage: QImage | None = None
+        # Untouched pixmap reused while every adjustment sits at its
+        # default, so the common "sliders never moved" case skips the
+        # whole pipeline.
+        self._identity_pixmap: QPixmap | None = None
         self._brightness = 0
         self._contrast = 0
         self._gamma = 1.0
+        # Cached tone curve: the source is uint8, so brightness/contrast/
+        # gamma collapse into one 256-entry LUT rebuilt only when the
+        # settings change.
+        self._tone_lut_cache: np.ndarray | None = None
+        self._tone_lut_key: tuple | None = None
+        # Persistent display buffer shared zero-copy with _display_qimage;
+        # the QImage wraps this memory, so both must stay alive together.
+        self._display_buf: np.ndarray | None = None
+        # True while _display_buf holds toned pixels; the identity
+        # short-circuit restores the pristine image before anything
+        # (the magnifier) crops _display_qimage again.
+        self._display_buf_stale = False
+        # Per-image channel stats for auto-enhance, computed once per load.
+        self._auto_enhance_params: tuple[np.ndarray, np.ndarray] | None = None
+        # Coalesces slider storms: a fast-moving slider fires valueChanged
+        # far faster than the tone pipeline runs, so only the last value
+        # within the interval is rendered.
+        self._adjust_timer = QTimer(self)
+        self._adjust_timer.setSingleShot(True)
+        self._adjust_timer.setInterval(16)
+        self._adjust_timer.timeout.connect(self._apply_adjustments_now)
+        # Half-resolution copies used while a slider is held down; the
+        # full-resolution pipeline runs again on release.
+        self._live_preview = False
+        self._original_np_preview: np.ndarray | None = None
+        self._preview_buf: np.ndarray | None = None
+        self._preview_qimage: QImage | None = None
+        self._scratch_f: np.ndarray | None = None
+        self._preview_scratch_f: np.ndarray | None = None
+        # GPU mirror of the source pixels when CuPy is available.
+        self._original_cp = None
+        # Mouse moves arrive far faster than frames can render; the
+        # non-panning work (scene mapping, preview geometry, hover
+        # hit-tests) is coalesced to roughly the display refresh rate and
+        # runs once with the latest position (see mouseMoveEvent).
+        self._pending_move_pos: QPoint | None = None
+        # Last mouse position seen in viewport coordinates; lets keyboard
+        # paths reuse it instead of round-tripping through QCursor.pos().
+        self._last_mouse_view_pos: QPoint | None = None
+        # Last viewport cursor set by hover handling; None whenever some
+        # other path (pan, space-pan) changed the cursor underneath it.
+        self._last_hover_cursor = None
+        # Wheel/pinch deltas accumulate multiplicatively and apply in one
+        # scale() call once the event queue drains; see _flush_zoom.
+        self._pending_zoom_factor = 1.0
+        self._zoom_flush_scheduled = False
+        # Resize bursts collapse to one refit per event-loop turn; see
+        # resizeEvent.
+        self._resize_pending = False
+        # Pre-rendered highlight rings for the magnifier, keyed by
+        # (class, radius); see _ring_pixmap.
+        self._ring_cache: Dict[tuple, QPixmap] = {}
+        # (x, y, class, radius) of the last rendered magnifier crop;
+        # sub-pixel drags and repeat calls with the same key skip the
+        # copy/smooth-scale/paint cycle entirely.
+        self._magnifier_cache_key: tuple | None = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._process_pending_move)
+        # Dirty flags plus a coalescing timer for state emission; see
+        # _mark_dirty.
+        self._dirty = {"points": False, "bboxes": False, "bones": False}
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(8)
+        self._state_timer.timeout.connect(self._flush_state_changes)
         self._auto_enhance = False
         self._edge_enhance = False
         self._dot_radius = LandmarkPointItem.DEFAULT_RADIUS
@@ -123,6 +324,7 @@ class ImageCanvas(QGraphicsView):
 
     def set_mode(self, mode: CanvasMode) -> None:
         self._mode = mode
+        self._update_three_point_active()
         is_landmark = (mode == CanvasMode.LANDMARK)
         is_bone = (mode == CanvasMode.BONE)
         
@@ -132,9 +334,17 @@ class ImageCanvas(QGraphicsView):
             # Let's assume we want to see them but not interact, effectively like landmark mode.
             # Let's assume we want to see them but not interact, effectively like landmark mode.
             
-        for point_item in self._point_items.values():
-            point_item.set_bbox_mode(not is_landmark)
-            
+        if is_landmark:
+            for point_item in self._point_items.values():
+                point_item.set_bbox_mode(False)
+        else:
+            # Points are read-only outside landmark mode: hide the
+            # interactive items and paint them all through the batched
+            # overlay instead.
+            for point_item in self._point_items.values():
+                point_item.setVisible(False)
+        self._refresh_points_overlay()
+
         # Update visibility/interactivity of bone lines?
         # Maybe we only want to interact with them in BONE mode.
         for bone_item in self._bone_line_items.values():
@@ -145,26 +355,51 @@ class ImageCanvas(QGraphicsView):
                 bone_item.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
             else:
                 bone_item.setAcceptedMouseButtons(Qt.NoButton)
-        for point_item in self._point_items.values():
-            point_item.set_bbox_mode(not is_landmark)
         self.clear_selection()
+        self._update_viewport_culling()
         self.viewport().update()
 
     def set_bbox_filter(self, filter_label: str) -> None:
         """Set the bbox filter and update visibility of all bboxes."""
         self._bbox_filter = filter_label
+        self._update_viewport_culling()
+
+    def _bbox_passes_filter(self, bbox_id: int) -> bool:
+        if self._bbox_filter == "All":
+            return True
+        return self._bboxes[bbox_id].get("label", "Unlabeled") == self._bbox_filter
+
+    def _update_viewport_culling(self) -> None:
+        """Hide annotation items wholly outside the viewport.
+
+        Qt still walks every visible item when dispatching paints and
+        events; culling keeps that walk proportional to what is actually
+        on screen. A margin lets items reappear before their bounds fully
+        scroll in.
+        """
+        if not self.has_image():
+            return
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        visible = visible.adjusted(-64, -64, 64, 64)
         for bbox_id, item in self._bbox_items.items():
-            bbox_label = self._bboxes[bbox_id].get("label", "Unlabeled")
-            if filter_label == "All":
-                item.setVisible(True)
-            else:
-                item.setVisible(bbox_label == filter_label)
+            item.setVisible(
+                self._bbox_passes_filter(bbox_id)
+                and visible.intersects(item.sceneBoundingRect())
+            )
+        if self._mode == CanvasMode.LANDMARK:
+            # Outside landmark mode the per-point items stay hidden; the
+            # batched overlay paints them instead.
+            for item in self._point_items.values():
+                item.setVisible(visible.intersects(item.sceneBoundingRect()))
+        for item in self._bone_line_items.values():
+            item.setVisible(visible.intersects(item.sceneBoundingRect()))
 
     def has_image(self) -> bool:
         return not self._pixmap_item.pixmap().isNull()
 
     def clear(self) -> None:
         self._pixmap_item.setPixmap(QPixmap())
+        self._auto_enhance_params = None
         self._scene.setSceneRect(QRectF())
         self._clear_points()
         self._clear_bboxes()
@@ -172,25 +407,86 @@ class ImageCanvas(QGraphicsView):
         self._zoom_percent = 100
         self.zoomChanged.emit(self._zoom_percent)
         self.viewport().setCursor(Qt.ArrowCursor)
+        self._last_hover_cursor = None
         self._zoom_factor = 1.0
         self._base_scale = 1.0
 
-    def load_image(self, path: str) -> tuple[int, int]:
+    @staticmethod
+    def decode_image(path: str) -> QImage:
+        """Decode ``path`` into the paint engine's native format.
+
+        This is the CPU-heavy half of loading and touches nothing but the
+        file, so callers may run it on a worker thread and hand the result
+        to :meth:`apply_decoded_image` on the GUI thread.
+        """
         image = QImage(path)
         if image.isNull():
             raise ValueError(f"Unable to load image: {path}")
-        rgba = image.convertToFormat(QImage.Format_RGBA8888)
-        ptr = rgba.bits()
+        # Premultiplied ARGB32 is the raster paint engine's native format:
+        # converting once here means QPixmap.fromImage later can take the
+        # pixels as-is instead of re-converting the whole frame per update.
+        # Source alpha is always opaque, so premultiplication leaves the
+        # colour bytes untouched and the tone pipeline (which treats the
+        # three colour channels symmetrically) is unaffected by the
+        # BGRA byte order.
+        return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+    def load_image(self, path: str) -> tuple[int, int]:
+        return self.apply_decoded_image(self.decode_image(path))
+
+    def apply_decoded_image(self, rgba: QImage) -> tuple[int, int]:
+        ptr = rgba.constBits()
         ptr.setsize(rgba.byteCount())
-        arr = np.frombuffer(ptr, dtype=np.uint8).reshape((rgba.height(), rgba.width(), 4)).copy()
+        # Wrap the QImage's own pixels instead of copying them out: the
+        # explicit strides handle any scanline padding, and keeping the
+        # QImage alive on self keeps the underlying buffer valid. The
+        # adjustment pipeline only ever reads _original_np and writes into
+        # _display_buf, so the view never needs to be writable.
+        arr = np.ndarray(
+            shape=(rgba.height(), rgba.width(), 4),
+            dtype=np.uint8,
+            buffer=ptr,
+            strides=(rgba.bytesPerLine(), 4, 1),
+        )
+        self._qimage_owner = rgba
         self._original_np = arr
-        display_pixmap = QPixmap.fromImage(rgba)
-        self._display_qimage = rgba
+        self._auto_enhance_params = None
+        # Display QImage wraps the buffer's memory: adjustments write into
+        # _display_buf in place and no per-refresh QImage copy is needed.
+        self._display_buf = arr.copy()
+        self._display_buf_stale = False
+        self._display_qimage = QImage(
+            self._display_buf.data,
+            rgba.width(),
+            rgba.height(),
+            rgba.width() * 4,
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        # Built from the pristine source image (not _display_qimage, whose
+        # buffer later adjustments overwrite in place) and kept for the
+        # identity short-circuit in _apply_adjustments_now.
+        self._identity_pixmap = QPixmap.fromImage(rgba, Qt.NoFormatConversion)
+        display_pixmap = self._identity_pixmap
+        self._original_np_preview = arr[::2, ::2].copy()
+        self._preview_buf = self._original_np_preview.copy()
+        ph, pw = self._preview_buf.shape[:2]
+        self._preview_qimage = QImage(
+            self._preview_buf.data, pw, ph, pw * 4, QImage.Format_ARGB32_Premultiplied
+        )
+        # Float32 scratch buffers for the enhance pipeline, sized once per
+        # load so each slider tick reuses them instead of allocating
+        # multi-megabyte temporaries.
+        self._scratch_f = np.empty((rgba.height(), rgba.width(), 3), dtype=np.float32)
+        self._preview_scratch_f = np.empty((ph, pw, 3), dtype=np.float32)
+        # Upload the source once so the tone math can run on the GPU; only
+        # the finished uint8 frame comes back over the bus per update.
+        self._original_cp = cp.asarray(arr) if cp is not None else None
         self._clear_points()
         self._clear_bboxes()
         self._pixmap_item.setPixmap(display_pixmap)
         width, height = display_pixmap.width(), display_pixmap.height()
         self._image_rect = QRectF(0, 0, width, height)
+        self._image_bounds = (0.0, 0.0, float(width), float(height))
         self._scene.setSceneRect(self._image_rect)
         self.resetTransform()
         if not self._image_rect.isNull():
@@ -202,7 +498,8 @@ class ImageCanvas(QGraphicsView):
         self.zoomChanged.emit(self._zoom_percent)
         self.viewport().update()
         self.viewport().setCursor(Qt.CrossCursor)
-        self._apply_adjustments()
+        self._last_hover_cursor = None
+        self._apply_adjustments_now()
         self._hide_magnifier()
         return width, height
 
@@ -210,13 +507,20 @@ class ImageCanvas(QGraphicsView):
         for item in self._point_items.values():
             self._scene.removeItem(item)
         self._point_items.clear()
-        self._points.clear()
+        self._point_id_to_idx.clear()
+        self._point_ids.clear()
+        self._point_cls.clear()
+        self._point_radii.clear()
+        self._point_count = 0
+        self._class_counts.clear()
+        self._points_overlay.setVisible(False)
         self._selected_point_id = None
         self.countsChanged.emit(0, 0, 0)
         self._hide_magnifier()
 
     def _clear_bboxes(self) -> None:
         for item in self._bbox_items.values():
+            self._spatial_index.remove(item)
             self._scene.removeItem(item)
         self._bbox_items.clear()
         self._bboxes.clear()
@@ -226,16 +530,40 @@ class ImageCanvas(QGraphicsView):
 
     def set_points(self, points: List[Dict[str, float | str]]) -> None:
         self._clear_points()
-        for point in points:
-            cls = normalize_class(point.get("class", "CEJ"))
-            x = float(point.get("x", 0))
-            y = float(point.get("y", 0))
-            radius = float(point.get("radius", self._dot_radius))
-            self._create_point(cls, QPointF(x, y), point_id=str(uuid.uuid4()), emit=False, radius=radius)
+        self.setUpdatesEnabled(False)
+        self._scene.blockSignals(True)
+        try:
+            for point in points:
+                cls = normalize_class(point.get("class", "CEJ"))
+                x = float(point.get("x", 0))
+                y = float(point.get("y", 0))
+                radius = float(point.get("radius", self._dot_radius))
+                self._create_point(cls, QPointF(x, y), point_id=str(uuid.uuid4()), emit=False, radius=radius)
+        finally:
+            self._scene.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self._refresh_points_overlay()
         self.countsChanged.emit(*self._count_items())
 
+    def _refresh_points_overlay(self) -> None:
+        """Rebuild the batched points overlay from the current points."""
+        if self._mode == CanvasMode.LANDMARK or not self._point_count:
+            self._points_overlay.setVisible(False)
+            return
+        entries = [
+            (float(xy[0]), float(xy[1]), radius, class_color(cls))
+            for xy, radius, cls in zip(
+                self._point_xy[: self._point_count],
+                self._point_radii,
+                self._point_cls,
+            )
+        ]
+        self._points_overlay.set_entries(entries, self._image_rect)
+        self._points_overlay.setVisible(True)
+
     def _clear_bone_lines(self) -> None:
         for item in self._bone_line_items.values():
+            self._spatial_index.remove(item)
             self._scene.removeItem(item)
         self._bone_line_items.clear()
         self._bone_lines.clear()
@@ -248,16 +576,32 @@ class ImageCanvas(QGraphicsView):
 
     def set_bone_lines(self, bone_lines: List[List[Dict[str, float]]]) -> None:
         self._clear_bone_lines()
-        for line_points in bone_lines:
-            # line_points is a list of dicts {x, y}
-            points = [QPointF(float(p["x"]), float(p["y"])) for p in line_points]
-            if not points:
-                continue
-            self._create_bone_line(points, emit=False)
+        self.setUpdatesEnabled(False)
+        self._scene.blockSignals(True)
+        try:
+            for line_points in bone_lines:
+                # line_points is a list of dicts {x, y}
+                points = [QPointF(float(p["x"]), float(p["y"])) for p in line_points]
+                if not points:
+                    continue
+                self._create_bone_line(points, emit=False)
+        finally:
+            self._scene.blockSignals(False)
+            self.setUpdatesEnabled(True)
         self._emit_state_changed()
 
     def set_bboxes(self, bboxes: List[Dict[str, int | float | str]]) -> None:
         self._clear_bboxes()
+        self.setUpdatesEnabled(False)
+        self._scene.blockSignals(True)
+        try:
+            self._set_bboxes_inner(bboxes)
+        finally:
+            self._scene.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self.countsChanged.emit(*self._count_items())
+
+    def _set_bboxes_inner(self, bboxes: List[Dict[str, int | float | str]]) -> None:
         for bbox in bboxes:
             # Handle both OBB format (cx, cy, width, height, rotation) and legacy AABB format
             if "cx" in bbox:
@@ -283,7 +627,6 @@ class ImageCanvas(QGraphicsView):
             rect = QRectF(QPointF(xmin, ymin), QPointF(xmax, ymax))
             label = str(bbox.get("label", BBOX_CLASSES[0]))
             self._create_bbox(rect, rotation=rotation, label=label, emit=False)
-        self.countsChanged.emit(*self._count_items())
 
     def _create_point(
         self,
@@ -303,17 +646,25 @@ class ImageCanvas(QGraphicsView):
         item.moved.connect(self._on_point_moved)
         item.deleteRequested.connect(self._on_point_deleted)
         item.selected.connect(self._on_point_selected)
+        # Static points repaint as cached blits on pan/zoom; the selected
+        # point drops the cache while it is being dragged (see _select_point).
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self._scene.addItem(item)
         self._point_items[point_id] = item
-        self._points[point_id] = {
-            "x": clamped_pos.x(),
-            "y": clamped_pos.y(),
-            "class": label,
-            "radius": point_radius,
-        }
-        self._select_point(item)
+        self._ensure_point_capacity()
+        idx = self._point_count
+        self._point_id_to_idx[point_id] = idx
+        self._point_ids.append(point_id)
+        self._point_xy[idx] = (clamped_pos.x(), clamped_pos.y())
+        self._point_cls.append(label)
+        self._point_radii.append(point_radius)
+        self._point_count = idx + 1
+        self._class_counts[label] += 1
         if emit:
-            self._emit_state_changed()
+            # Bulk loads skip the per-item selection (and its magnifier
+            # update); only interactively added points get selected.
+            self._select_point(item)
+            self._mark_dirty("points")
         
         # Initialize with correct mode state
         item.set_bbox_mode(self._mode == CanvasMode.BBOX)
@@ -336,11 +687,12 @@ class ImageCanvas(QGraphicsView):
             item.setAcceptedMouseButtons(Qt.NoButton)
              
         self._scene.addItem(item)
+        self._spatial_index.insert(item)
         self._bone_line_items[line_id] = item
         self._bone_lines[line_id] = [{"x": p.x(), "y": p.y()} for p in points]
-        
+
         if emit:
-            self._emit_state_changed()
+            self._mark_dirty("bones")
             
         return item
 
@@ -368,6 +720,7 @@ class ImageCanvas(QGraphicsView):
         item.set_landmark_mode(is_landmark or is_bone)
         
         self._scene.addItem(item)
+        self._spatial_index.insert(item)
         self._bbox_items[bbox_id] = item
         
         # Store in OBB format
@@ -385,9 +738,9 @@ class ImageCanvas(QGraphicsView):
             "rotation": rotation,
             "label": final_label,
         }
-        
+
         if emit:
-            self._emit_state_changed()
+            self._mark_dirty("bboxes")
 
     def add_point_at(self, scene_pos: QPointF, label: str) -> None:
         if not self.has_image():
@@ -397,8 +750,15 @@ class ImageCanvas(QGraphicsView):
     def set_bbox_draw_mode(self, mode: BBoxDrawMode) -> None:
         """Set the bounding box drawing mode (drag or three-point)."""
         self._bbox_draw_mode = mode
+        self._update_three_point_active()
         self._clear_three_point_state()
 
+    def _update_three_point_active(self) -> None:
+        self._three_point_active = (
+            self._mode == CanvasMode.BBOX
+            and self._bbox_draw_mode == BBoxDrawMode.THREE_POINT
+        )
+
     def _handle_three_point_click(self, pos: QPointF) -> None:
         """Handle click events for three-point bbox drawing."""
         if not self._image_rect.contains(pos):
@@ -415,39 +775,31 @@ class ImageCanvas(QGraphicsView):
 
     def _update_three_point_preview(self, cursor_pos: QPointF) -> None:
         """Update the preview visualization for three-point drawing."""
-        # Clear existing preview items
-        if self._preview_line:
-            self._scene.removeItem(self._preview_line)
-            self._preview_line = None
-        if self._preview_polygon:
-            self._scene.removeItem(self._preview_polygon)
-            self._preview_polygon = None
-        
+        key = (int(cursor_pos.x()), int(cursor_pos.y()), len(self._three_point_corners))
+        if key == self._three_point_preview_key:
+            return
+        self._three_point_preview_key = key
         if not self._three_point_corners:
+            self._preview_line.setVisible(False)
+            self._preview_polygon.setVisible(False)
             return
-        
+
         if len(self._three_point_corners) == 1:
             # Draw line from first point to cursor
-            pen = QPen(QColor(255, 255, 0), 2, Qt.DashLine)
-            self._preview_line = QGraphicsLineItem(
+            self._preview_line.setLine(
                 self._three_point_corners[0].x(),
                 self._three_point_corners[0].y(),
                 cursor_pos.x(),
                 cursor_pos.y()
             )
-            self._preview_line.setPen(pen)
-            self._preview_line.setZValue(10)
-            self._scene.addItem(self._preview_line)
-            
+            self._preview_line.setVisible(True)
+            self._preview_polygon.setVisible(False)
+
         elif len(self._three_point_corners) == 2:
             # Draw preview polygon showing the prospective bbox
-            # pylint: disable=no-name-in-module
-            from PyQt5.QtGui import QPolygonF, QBrush
-            # pylint: enable=no-name-in-module
-            
             p1, p2 = self._three_point_corners[0], self._three_point_corners[1]
             p3 = cursor_pos
-            
+
             # Calculate the fourth corner
             # p1 = top-left, p2 = top-right, p3 = bottom-right
             # p4 = bottom-left
@@ -458,23 +810,17 @@ class ImageCanvas(QGraphicsView):
                 p1.x() + (p3.x() - p2.x()),
                 p1.y() + (p3.y() - p2.y())
             )
-            
-            polygon = QPolygonF([p1, p2, p3, p4])
-            self._preview_polygon = QGraphicsPolygonItem(polygon)
-            self._preview_polygon.setPen(QPen(QColor(255, 255, 0), 2, Qt.DashLine))
-            self._preview_polygon.setBrush(QBrush(QColor(255, 255, 0, 50)))
-            self._preview_polygon.setZValue(10)
-            self._scene.addItem(self._preview_polygon)
+
+            self._preview_polygon.setPolygon(QPolygonF([p1, p2, p3, p4]))
+            self._preview_polygon.setVisible(True)
+            self._preview_line.setVisible(False)
 
     def _clear_three_point_state(self) -> None:
-        """Clear three-point drawing state and preview items."""
+        """Clear three-point drawing state and hide preview items."""
         self._three_point_corners.clear()
-        if self._preview_line:
-            self._scene.removeItem(self._preview_line)
-            self._preview_line = None
-        if self._preview_polygon:
-            self._scene.removeItem(self._preview_polygon)
-            self._preview_polygon = None
+        self._three_point_preview_key = None
+        self._preview_line.setVisible(False)
+        self._preview_polygon.setVisible(False)
 
     def _calculate_obb_from_three_points(self) -> tuple[QRectF, float]:
         """Calculate oriented bounding box from three corner points.
@@ -486,21 +832,24 @@ class ImageCanvas(QGraphicsView):
             return QRectF(), 0.0
         
         p1, p2, p3 = self._three_point_corners
-        
-        # Calculate width (distance from p1 to p2)
-        width = math.sqrt((p2.x() - p1.x())**2 + (p2.y() - p1.y())**2)
-        
-        # Calculate height (distance from p2 to p3)
-        height = math.sqrt((p3.x() - p2.x())**2 + (p3.y() - p2.y())**2)
-        
+        # Pull the coordinates into locals once; each QPointF accessor is a
+        # bound-method call through the Qt bindings.
+        x1, y1 = p1.x(), p1.y()
+        x2, y2 = p2.x(), p2.y()
+        x3, y3 = p3.x(), p3.y()
+
+        # Width (distance from p1 to p2) and height (distance from p2 to p3)
+        width = math.hypot(x2 - x1, y2 - y1)
+        height = math.hypot(x3 - x2, y3 - y2)
+
         # Calculate rotation (angle from p1 to p2)
-        rotation = math.degrees(math.atan2(p2.y() - p1.y(), p2.x() - p1.x()))
-        
+        rotation = math.degrees(math.atan2(y2 - y1, x2 - x1))
+
         # Calculate center
         # The center is at the middle of the diagonal from p1 to p3
-        center_x = (p1.x() + p3.x()) / 2
-        center_y = (p1.y() + p3.y()) / 2
-        
+        center_x = (x1 + x3) / 2
+        center_y = (y1 + y3) / 2
+
         # Create rect centered at origin (will be positioned by setPos in BoundingBoxItem)
         rect = QRectF(
             center_x - width / 2,
@@ -512,12 +861,13 @@ class ImageCanvas(QGraphicsView):
         return rect, rotation
 
     def _on_point_moved(self, point_id: str, x: float, y: float) -> None:
-        self._points[point_id]["x"] = x
-        self._points[point_id]["y"] = y
-        self._emit_state_changed()
+        idx = self._point_id_to_idx.get(point_id)
+        if idx is not None:
+            self._point_xy[idx] = (x, y)
+        self._mark_dirty("points")
         item = self._point_items.get(point_id)
-        if self._selected_point_id == point_id and item is not None:
-            self._update_magnifier(QPointF(x, y), self._points[point_id]["class"], item.radius())
+        if self._selected_point_id == point_id and item is not None and idx is not None:
+            self._update_magnifier(QPointF(x, y), self._point_cls[idx], item.radius())
 
     def _on_point_selected(self, point_id: str) -> None:
         item = self._point_items.get(point_id)
@@ -528,12 +878,38 @@ class ImageCanvas(QGraphicsView):
         item = self._point_items.pop(point_id, None)
         if item:
             self._scene.removeItem(item)
-        if point_id in self._points:
-            del self._points[point_id]
+        idx = self._point_id_to_idx.pop(point_id, None)
+        if idx is not None:
+            self._class_counts[self._point_cls[idx]] -= 1
+            # Swap-last removal keeps the arrays contiguous without a shift.
+            last = self._point_count - 1
+            if idx != last:
+                moved_id = self._point_ids[last]
+                self._point_ids[idx] = moved_id
+                self._point_xy[idx] = self._point_xy[last]
+                self._point_cls[idx] = self._point_cls[last]
+                self._point_radii[idx] = self._point_radii[last]
+                self._point_id_to_idx[moved_id] = idx
+            self._point_ids.pop()
+            self._point_cls.pop()
+            self._point_radii.pop()
+            self._point_count = last
         if self._selected_point_id == point_id:
             self._selected_point_id = None
             self._hide_magnifier()
-        self._emit_state_changed()
+        self._mark_dirty("points")
+
+    def _point_class(self, point_id: str | None) -> str | None:
+        idx = self._point_id_to_idx.get(point_id)
+        return self._point_cls[idx] if idx is not None else None
+
+    def _ensure_point_capacity(self) -> None:
+        if self._point_count < len(self._point_xy):
+            return
+        new_cap = max(64, len(self._point_xy) * 2)
+        xy = np.empty((new_cap, 2), dtype=np.float32)
+        xy[: self._point_count] = self._point_xy[: self._point_count]
+        self._point_xy = xy
 
     def _on_bbox_moved(self, bbox_id: int, x_center: float, y_center: float, width: float, height: float, rotation: float) -> None:
         if bbox_id in self._bboxes:
@@ -582,12 +958,15 @@ class ImageCanvas(QGraphicsView):
                 "rotation": rotation,
                 "label": self._bboxes[bbox_id].get("label", BBOX_CLASSES[0]),
             }
-            self._emit_state_changed()
+            item = self._bbox_items.get(bbox_id)
+            if item:
+                self._spatial_index.update(item)
+            self._mark_dirty("bboxes")
 
     def _on_bbox_label_changed(self, bbox_id: int, label: str) -> None:
         if bbox_id in self._bboxes:
             self._bboxes[bbox_id]["label"] = label
-            self._emit_state_changed()
+            self._mark_dirty("bboxes")
 
     def _on_bbox_selected(self, bbox_id: int) -> None:
         item = self._bbox_items.get(bbox_id)
@@ -597,23 +976,28 @@ class ImageCanvas(QGraphicsView):
     def _on_bbox_deleted(self, bbox_id: int) -> None:
         item = self._bbox_items.pop(bbox_id, None)
         if item:
+            self._spatial_index.remove(item)
             self._scene.removeItem(item)
         if bbox_id in self._bboxes:
             del self._bboxes[bbox_id]
         if self._selected_bbox_id == bbox_id:
             self._selected_bbox_id = None
-        self._emit_state_changed()
+        self._mark_dirty("bboxes")
 
     def _select_point(self, item: LandmarkPointItem | None) -> None:
         if item is not None:
             self._select_bbox(None) # Deselect bbox if selecting a point
         
         if self._selected_point_id and self._selected_point_id in self._point_items:
-            self._point_items[self._selected_point_id].set_selected(False)
+            prev = self._point_items[self._selected_point_id]
+            prev.set_selected(False)
+            prev.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         if item is not None:
             self._selected_point_id = item.point_id
             item.set_selected(True)
-            self._update_magnifier(item.pos(), self._points.get(item.point_id, {}).get("class"), item.radius())
+            # No cache while selected so live drags repaint cleanly.
+            item.setCacheMode(QGraphicsItem.NoCache)
+            self._update_magnifier(item.pos(), self._point_class(item.point_id), item.radius())
         else:
             self._selected_point_id = None
             self._hide_magnifier()
@@ -641,6 +1025,7 @@ class ImageCanvas(QGraphicsView):
         self.deselect_all()
         self._clear_three_point_state()
         self.viewport().setCursor(Qt.ArrowCursor if not self.has_image() else Qt.CrossCursor)
+        self._last_hover_cursor = None
 
     def delete_selected_item(self) -> None:
         if self._selected_point_id is not None:
@@ -659,89 +1044,250 @@ class ImageCanvas(QGraphicsView):
             return
         new_pos = self._clamp_to_image(item.pos() + QPointF(dx, dy))
         item.setPos(new_pos)
-        point = self._points.get(self._selected_point_id)
-        if point is not None:
-            point["x"] = new_pos.x()
-            point["y"] = new_pos.y()
+        idx = self._point_id_to_idx.get(self._selected_point_id)
+        if idx is not None:
+            self._point_xy[idx] = (new_pos.x(), new_pos.y())
         self._update_magnifier(
             new_pos,
-            self._points.get(self._selected_point_id, {}).get("class"),
+            self._point_class(self._selected_point_id),
             item.radius(),
         )
-        self._emit_state_changed()
+        self._mark_dirty("points")
 
     def set_adjustments(self, brightness: int, contrast: int, gamma: float) -> None:
+        gamma = max(0.1, gamma)
+        if (brightness, contrast, gamma) == (self._brightness, self._contrast, self._gamma):
+            # Already rendered with these values — the per-load
+            # _apply_adjustments_now keeps the display in sync, so the
+            # unconditional call after each navigation costs nothing.
+            return
         self._brightness = brightness
         self._contrast = contrast
-        self._gamma = max(0.1, gamma)
+        self._gamma = gamma
         self._apply_adjustments()
 
+    def set_live_preview(self, enabled: bool) -> None:
+        """Render against the half-resolution copy while a slider is held."""
+        if self._live_preview == enabled:
+            return
+        self._live_preview = enabled
+        if not enabled:
+            # Swap the full-resolution result back in immediately.
+            self._apply_adjustments_now()
+
     def set_enhancements(self, auto_enhance: bool, edge_enhance: bool) -> None:
+        if (auto_enhance, edge_enhance) == (self._auto_enhance, self._edge_enhance):
+            return
         self._auto_enhance = auto_enhance
         self._edge_enhance = edge_enhance
         self._apply_adjustments()
 
+    def _tone_lut(self, brightness: int, contrast: int, gamma: float) -> np.ndarray:
+        """256-entry uint8 LUT folding brightness, contrast and gamma."""
+        key = (brightness, contrast, gamma)
+        if self._tone_lut_key != key:
+            values = np.arange(256, dtype=np.float32)
+            values = values * (1.0 + contrast / 100.0) + brightness
+            np.clip(values, 0.0, 255.0, out=values)
+            values = (values / 255.0) ** np.float32(1.0 / gamma) * 255.0
+            self._tone_lut_cache = np.clip(values, 0, 255).astype(np.uint8)
+            self._tone_lut_key = key
+        return self._tone_lut_cache
+
     def _apply_adjustments(self) -> None:
-        if self._original_np is None:
+        # Restarting the single-shot timer drops any still-pending render,
+        # so a drag only pays for the most recent value.
+        self._adjust_timer.start()
+
+    def _apply_adjustments_now(self) -> None:
+        if self._original_np is None or self._display_buf is None:
             return
-        arr = self._original_np.astype(np.float32)
-        rgb = arr[..., :3]
-        if self._auto_enhance:
-            rgb = self._auto_enhance_channels(rgb)
-        rgb = rgb * (1.0 + self._contrast / 100.0) + self._brightness
-        rgb = np.clip(rgb, 0, 255)
         gamma = max(0.1, self._gamma)
-        norm = np.clip(rgb / 255.0, 0, 1)
-        rgb = np.power(norm, 1.0 / gamma) * 255.0
-        if self._edge_enhance:
-            rgb = self._edge_enhance_channels(rgb)
-        arr[..., :3] = np.clip(rgb, 0, 255)
-        arr = arr.astype(np.uint8)
-        height, width, _ = arr.shape
-        qimage = QImage(arr.data, width, height, width * 4, QImage.Format_RGBA8888).copy()
-        self._display_qimage = qimage
-        self._pixmap_item.setPixmap(QPixmap.fromImage(qimage))
+        if (
+            self._brightness == 0
+            and self._contrast == 0
+            and gamma == 1.0
+            and not self._auto_enhance
+            and not self._edge_enhance
+            and self._identity_pixmap is not None
+        ):
+            # All adjustments at their defaults: reuse the untouched
+            # pixmap instead of running the full pipeline.
+            if self._display_buf_stale:
+                # The magnifier crops _display_qimage, so the buffer has
+                # to match the pristine pixels going back on screen.
+                np.copyto(self._display_buf, self._original_np)
+                self._display_buf_stale = False
+            self._pixmap_item.setPixmap(self._identity_pixmap)
+            self._pixmap_item.setScale(1.0)
+            self._magnifier_cache_key = None
+            self._update_magnifier_from_selection()
+            return
+        if self._live_preview and self._preview_buf is not None:
+            src = self._original_np_preview
+            dst = self._preview_buf
+            qimage = self._preview_qimage
+            scratch = self._preview_scratch_f
+            item_scale = 2.0
+        else:
+            src = self._original_np
+            dst = self._display_buf
+            qimage = self._display_qimage
+            scratch = self._scratch_f
+            item_scale = 1.0
+            self._display_buf_stale = True
+        if not self._auto_enhance and not self._edge_enhance:
+            if self._original_cp is not None and dst is self._display_buf:
+                # GPU tone curve: identical math to the CPU float path but
+                # with the ALU and memory bandwidth of the device. Runs
+                # only at full resolution; the half-res preview is cheap
+                # enough on the CPU.
+                rgb = self._original_cp[..., :3].astype(cp.float32)
+                rgb *= 1.0 + self._contrast / 100.0
+                rgb += self._brightness
+                cp.clip(rgb, 0, 255, out=rgb)
+                rgb /= 255.0
+                cp.power(rgb, cp.float32(1.0 / gamma), out=rgb)
+                rgb *= 255.0
+                dst[..., :3] = cp.asnumpy(rgb.astype(cp.uint8))
+            elif _TONE_KERNEL_COMPILED:
+                # Fused single-pass kernel writing straight into the
+                # display buffer.
+                _apply_tone(
+                    src,
+                    dst,
+                    float(self._brightness),
+                    float(self._contrast),
+                    1.0 / gamma,
+                )
+            else:
+                # Fast path: the whole tone curve is a single uint8 gather,
+                # replacing per-pixel float multiplies and pow calls.
+                lut = self._tone_lut(self._brightness, self._contrast, gamma)
+                dst[..., :3] = lut[src[..., :3]]
+        else:
+            # Reuse the preallocated scratch buffer; the only remaining
+            # allocations in this path are inside the edge-enhance
+            # convolution.
+            rgb = scratch
+            np.copyto(rgb, src[..., :3])
+            # In-place float32 throughout: no FP64 upcast in the pow and no
+            # fresh temporary per operation.
+            contrast_scale = np.float32(1.0 + self._contrast / 100.0)
+            brightness = np.float32(self._brightness)
+            if self._auto_enhance:
+                # The auto-enhance stretch is linear and, because its
+                # offset/scale come from the image min/max, lands exactly
+                # in [0, 255] — so its own clip is a no-op and the
+                # per-channel constants fold algebraically into the
+                # contrast/brightness multiply-add. One fused pass instead
+                # of three.
+                offset, scale = self._auto_enhance_stats()
+                total_scale = scale * contrast_scale
+                rgb *= total_scale
+                rgb += brightness - offset * total_scale
+            else:
+                rgb *= contrast_scale
+                rgb += brightness
+            np.clip(rgb, 0, 255, out=rgb)
+            rgb /= 255.0
+            np.power(rgb, np.float32(1.0 / gamma), out=rgb)
+            rgb *= 255.0
+            if self._edge_enhance:
+                rgb = self._edge_enhance_channels(rgb)
+            np.clip(rgb, 0, 255, out=rgb)
+            dst[..., :3] = rgb
+        # The QImage wraps dst's memory, so the pixels are already up to
+        # date, and NoFormatConversion lets the pixmap adopt them without a
+        # per-frame format pass (the buffers are already premultiplied
+        # ARGB32). The pixmap item scale maps the half-resolution preview
+        # back to scene size.
+        self._pixmap_item.setPixmap(QPixmap.fromImage(qimage, Qt.NoFormatConversion))
+        self._pixmap_item.setScale(item_scale)
+        # The crop source just changed; force the magnifier to re-render.
+        self._magnifier_cache_key = None
         self._update_magnifier_from_selection()
 
     def serialize_points(self) -> List[Dict[str, float | str]]:
+        if not self._point_count:
+            return []
+        # One vectorized np.round straight over the coordinate block
+        # instead of two Python-level round() calls per point on every
+        # state emission.
+        xy = np.round(
+            self._point_xy[: self._point_count].astype(np.float64), 3
+        ).tolist()
         return [
-            {"x": round(data["x"], 3), "y": round(data["y"], 3), "class": data["class"], "radius": data.get("radius")}
-            for data in self._points.values()
+            {"x": x, "y": y, "class": cls, "radius": radius}
+            for (x, y), cls, radius in zip(xy, self._point_cls, self._point_radii)
         ]
 
     def serialize_bboxes(self) -> List[Dict[str, int | float | str]]:
+        if not self._bboxes:
+            return []
+        values = self._bboxes.values()
+        rows = np.round(
+            np.array(
+                [(d["cx"], d["cy"], d["width"], d["height"], d["rotation"]) for d in values],
+                dtype=np.float64,
+            ),
+            1,
+        ).tolist()
         return [
             {
-                "id": data["id"], 
-                "cx": round(data["cx"], 1), 
-                "cy": round(data["cy"], 1), 
-                "width": round(data["width"], 1), 
-                "height": round(data["height"], 1),
-                "rotation": round(data["rotation"], 1),
-                "label": data.get("label", BBOX_CLASSES[0]),
+                "id": d["id"],
+                "cx": row[0],
+                "cy": row[1],
+                "width": row[2],
+                "height": row[3],
+                "rotation": row[4],
+                "label": d.get("label", BBOX_CLASSES[0]),
             }
-            for data in self._bboxes.values()
+            for row, d in zip(rows, values)
         ]
 
     def serialize_bone_lines(self) -> List[List[Dict[str, float]]]:
         return list(self._bone_lines.values())
 
     def _emit_state_changed(self) -> None:
-        self.pointsUpdated.emit(self.serialize_points())
-        self.bboxesUpdated.emit(self.serialize_bboxes())
-        self.boneLinesUpdated.emit(self.serialize_bone_lines())
+        self._mark_dirty("points", "bboxes", "bones")
+
+    def _mark_dirty(self, *kinds: str) -> None:
+        """Queue a coalesced state emission for the given collections.
+
+        A drag fires change handlers per mouse move; re-serializing all
+        three collections each time is wasted work. Flags plus a short
+        single-shot timer mean only the collections that changed get
+        serialized, once per burst.
+        """
+        for kind in kinds:
+            self._dirty[kind] = True
+        self._state_timer.start()
+
+    def _flush_state_changes(self) -> None:
+        if self._dirty["points"]:
+            self.pointsUpdated.emit(self.serialize_points())
+        if self._dirty["bboxes"]:
+            self.bboxesUpdated.emit(self.serialize_bboxes())
+        if self._dirty["bones"]:
+            self.boneLinesUpdated.emit(self.serialize_bone_lines())
+        self._dirty = {"points": False, "bboxes": False, "bones": False}
         self.countsChanged.emit(*self._count_items())
 
     def _count_items(self) -> tuple[int, int, int]:
-        cej = sum(1 for data in self._points.values() if data["class"] == "CEJ")
-        crest = sum(1 for data in self._points.values() if data["class"] == "CREST")
-        bboxes = len(self._bboxes)
-        return cej, crest, bboxes
+        return (
+            self._class_counts.get("CEJ", 0),
+            self._class_counts.get("CREST", 0),
+            len(self._bboxes),
+        )
 
     def _on_bone_line_changed(self, line_id: str, points: List[Dict[str, float]]) -> None:
         if line_id in self._bone_lines:
             self._bone_lines[line_id] = points
-            self._emit_state_changed()
+            item = self._bone_line_items.get(line_id)
+            if item:
+                self._spatial_index.update(item)
+            self._mark_dirty("bones")
 
     def _on_bone_line_selected(self, line_id: str) -> None:
         item = self._bone_line_items.get(line_id)
@@ -751,6 +1297,7 @@ class ImageCanvas(QGraphicsView):
     def _on_bone_line_deleted(self, line_id: str) -> None:
         item = self._bone_line_items.pop(line_id, None)
         if item:
+            self._spatial_index.remove(item)
             self._scene.removeItem(item)
         if line_id in self._bone_lines:
             del self._bone_lines[line_id]
@@ -760,7 +1307,7 @@ class ImageCanvas(QGraphicsView):
             self._current_bone_line_item = None
             self._drawing_bone_line = False
             self._current_bone_line_points = []
-        self._emit_state_changed()
+        self._mark_dirty("bones")
 
     def _select_bone_line(self, item: BoneLineItem | None) -> None:
         if item is not None:
@@ -777,10 +1324,14 @@ class ImageCanvas(QGraphicsView):
             self._selected_bone_line_id = None
 
     def _clamp_to_image(self, pos: QPointF) -> QPointF:
-        if self._image_rect.isNull():
+        bounds = self._image_bounds
+        if bounds is None:
             return pos
-        x = min(max(self._image_rect.left(), pos.x()), self._image_rect.right())
-        y = min(max(self._image_rect.top(), pos.y()), self._image_rect.bottom())
+        left, top, right, bottom = bounds
+        x = pos.x()
+        y = pos.y()
+        x = left if x < left else (right if x > right else x)
+        y = top if y < top else (bottom if y > bottom else y)
         return QPointF(x, y)
 
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
@@ -797,18 +1348,20 @@ class ImageCanvas(QGraphicsView):
             self._panning = True
             self._pan_start = event.pos()
             self.viewport().setCursor(Qt.ClosedHandCursor)
+            self._last_hover_cursor = None
             event.accept()
             return
 
         if event.button() == Qt.LeftButton:
-            item = self.itemAt(event.pos())
-            
+            item = self._resolve_item(self.itemAt(event.pos()))
+            item_type = type(item)
+
             # Handle existing items
-            if isinstance(item, LandmarkPointItem):
+            if item_type is LandmarkPointItem:
                 self._select_point(item)
                 super().mousePressEvent(event)
                 return
-            elif isinstance(item, BoundingBoxItem):
+            elif item_type is BoundingBoxItem:
                 # Only interact with bboxes in BBOX mode
                 if self._mode == CanvasMode.BBOX:
                     self._select_bbox(item)
@@ -827,8 +1380,11 @@ class ImageCanvas(QGraphicsView):
                         event.accept()
                         return
                     else:
-                        # Drag mode: existing behavior  
+                        # Drag mode: existing behavior
                         self._drawing_bbox = True
+                        # The rubberband item changes geometry every frame;
+                        # skip BSP re-indexing for the duration of the drag.
+                        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
                         self._bbox_start = self.mapToScene(event.pos())
                         self._current_bbox_item = None
                         event.accept()
@@ -847,13 +1403,19 @@ class ImageCanvas(QGraphicsView):
         if not self._image_rect.contains(scene_pos):
             return
             
-        # Try to find a bone line under the cursor if nothing is selected
+        # Try to find a bone line under the cursor if nothing is selected.
+        # itemAt resolves the common case with a single indexed lookup;
+        # the grid-cell scan only runs when the topmost item is not a
+        # bone line (e.g. the cursor is over a landmark drawn above it).
         if not self._selected_bone_line_id:
-            items_at = self.items(scene_pos)
-            for item in items_at:
-                if isinstance(item, BoneLineItem):
-                    self._select_bone_line(item)
-                    break
+            top_item = self._resolve_item(self.itemAt(pos))
+            if type(top_item) is BoneLineItem:
+                self._select_bone_line(top_item)
+            else:
+                for item in self._spatial_index.items_at(scene_pos):
+                    if type(item) is BoneLineItem:
+                        self._select_bone_line(item)
+                        break
 
         menu = QMenu(self)
         add_action = menu.addAction("Add Point")
@@ -873,7 +1435,7 @@ class ImageCanvas(QGraphicsView):
                 item.add_point(scene_pos)
                 # Update our internal storage
                 self._bone_lines[self._selected_bone_line_id] = item.get_points()
-                self._emit_state_changed()
+                self._mark_dirty("bones")
             else:
                 # Start new line
                 newItem = self._create_bone_line([scene_pos])
@@ -889,33 +1451,40 @@ class ImageCanvas(QGraphicsView):
             event.accept()
             return
             
+        # Stash the latest position and let the timer slot do the real
+        # work at most once per ~16 ms; intermediate positions carry no
+        # information the final one does not.
+        self._pending_move_pos = QPoint(event.pos())
+        self._last_mouse_view_pos = self._pending_move_pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+        if self._drawing_bbox:
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def _process_pending_move(self) -> None:
+        pos = self._pending_move_pos
+        if pos is None:
+            return
+        self._pending_move_pos = None
+
         if self._drawing_bbox:
-            current_pos = self.mapToScene(event.pos())
+            current_pos = self.mapToScene(pos)
             rect = QRectF(self._bbox_start, current_pos).normalized()
             if self._current_bbox_item is None:
                 # Create temporary item (defaults to Unlabeled)
                 self._current_bbox_item = BoundingBoxItem(-1, rect, self._image_rect, label="Unlabeled")
                 self._scene.addItem(self._current_bbox_item)
             else:
-                # Update temporary item
-                # We need to manually update the rect since BoundingBoxItem stores it internally
-                # But BoundingBoxItem doesn't expose a setRect method in my previous implementation
-                # I should have added one. For now, I'll remove and recreate or just access protected member if I can't change it easily.
-                # Actually, I can just modify the _rect member since I'm in the same package/module context effectively? No.
-                # I'll just remove and add for simplicity or better yet, assume I can update it.
-                # Let's just recreate it for visual feedback or better, update BoundingBoxItem to have setRect.
-                # Since I can't easily update BoundingBoxItem now without another tool call, I'll just remove and add.
-                self._scene.removeItem(self._current_bbox_item)
-                self._current_bbox_item = BoundingBoxItem(-1, rect, self._image_rect, label="Unlabeled")
-                self._scene.addItem(self._current_bbox_item)
-            event.accept()
+                # Resize the temporary item in place; remove+recreate per
+                # move would rebalance the scene index every event.
+                self._current_bbox_item.set_rect(rect)
             return
-        
+
         # Three-point mode preview
-        if self._mode == CanvasMode.BBOX and self._bbox_draw_mode == BBoxDrawMode.THREE_POINT:
-            scene_pos = self.mapToScene(event.pos())
-            if self._three_point_corners:
-                self._update_three_point_preview(scene_pos)
+        if self._three_point_active and self._three_point_corners:
+            self._update_three_point_preview(self.mapToScene(pos))
 
         # Bone Line Preview (Rubber banding)
         if self._drawing_bone_line and self._current_bone_line_item:
@@ -924,8 +1493,7 @@ class ImageCanvas(QGraphicsView):
            # To implement: update self._current_bone_line_item.points[-1] if we added a tracking point.
            pass
 
-        self._update_hover_cursor(event.pos())
-        super().mouseMoveEvent(event)
+        self._update_hover_cursor(pos)
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         if self._panning and event.button() in (Qt.LeftButton, Qt.MiddleButton):
@@ -935,7 +1503,12 @@ class ImageCanvas(QGraphicsView):
             return
             
         if self._drawing_bbox and event.button() == Qt.LeftButton:
+            # Flush any move still waiting on the throttle timer so the
+            # rubberband item reflects the final drag position.
+            self._move_timer.stop()
+            self._process_pending_move()
             self._drawing_bbox = False
+            self._scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
             if self._current_bbox_item:
                 self._scene.removeItem(self._current_bbox_item)
                 rect = self._current_bbox_item.boundingRect() # This includes handles, wait.
@@ -959,8 +1532,26 @@ class ImageCanvas(QGraphicsView):
         delta = event.angleDelta().y() / 120
         if delta == 0:
             return
-        factor = 1.15 ** delta
-        self._set_zoom(self._zoom_factor * factor, centered=False)
+        self._queue_zoom(1.15 ** delta)
+
+    def _queue_zoom(self, factor: float) -> None:
+        """Accumulate a zoom factor and apply it after the queue drains.
+
+        Fast scroll wheels and pinch gestures deliver many small deltas
+        per frame; multiplying them together first means one transform
+        change and one zoomChanged emission per burst.
+        """
+        self._pending_zoom_factor *= factor
+        if not self._zoom_flush_scheduled:
+            self._zoom_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_zoom)
+
+    def _flush_zoom(self) -> None:
+        self._zoom_flush_scheduled = False
+        factor = self._pending_zoom_factor
+        self._pending_zoom_factor = 1.0
+        if factor != 1.0:
+            self._set_zoom(self._zoom_factor * factor, centered=False)
 
     def zoom_in(self) -> None:
         self._set_zoom(self._zoom_factor * 1.1, centered=True)
@@ -984,6 +1575,9 @@ class ImageCanvas(QGraphicsView):
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self._zoom_factor = zoom
         self._update_zoom_percent()
+        # Zooming out can grow the visible region without moving the
+        # scrollbars, so culling must be re-evaluated here too.
+        self._update_viewport_culling()
         self._position_magnifier()
 
     def _update_zoom_percent(self) -> None:
@@ -996,6 +1590,17 @@ class ImageCanvas(QGraphicsView):
 
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
+        if self._image_rect.isNull():
+            return
+        # Resize drags fire dozens of events per second; defer the refit
+        # so only the final geometry in each event-loop turn pays for the
+        # transform rebuild, zoom restore and signal emission.
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(0, self._handle_resize)
+
+    def _handle_resize(self) -> None:
+        self._resize_pending = False
         if self._image_rect.isNull():
             return
         prev_zoom = self._zoom_factor
@@ -1008,10 +1613,12 @@ class ImageCanvas(QGraphicsView):
         self._update_zoom_percent()
         if not math.isclose(prev_zoom, 1.0, abs_tol=1e-3):
             self._set_zoom(prev_zoom, centered=True)
+        self._update_viewport_culling()
         self._position_magnifier()
 
     def scrollContentsBy(self, dx: int, dy: int) -> None:  # type: ignore[override]
         super().scrollContentsBy(dx, dy)
+        self._update_viewport_culling()
         self._position_magnifier()
 
     def _position_magnifier(self) -> None:
@@ -1025,6 +1632,13 @@ class ImageCanvas(QGraphicsView):
             return
         x = int(scene_pos.x())
         y = int(scene_pos.y())
+        class_label = label or self._point_class(self._selected_point_id)
+        key = (x, y, class_label, radius)
+        if key == self._magnifier_cache_key and self._magnifier.isVisible():
+            # Same source pixel, class and radius: the rendered crop is
+            # identical, only its screen position can have changed.
+            self._position_magnifier()
+            return
         half = 30
         rect = QRect(x - half, y - half, half * 2, half * 2)
         rect = rect.intersected(self._display_qimage.rect())
@@ -1035,44 +1649,72 @@ class ImageCanvas(QGraphicsView):
             self._hide_magnifier()
             return
         snippet = self._display_qimage.copy(rect)
+        # Bilinear filtering on every intermediate frame is wasted work;
+        # nearest-neighbour is fine while an interaction is still in
+        # flight, and the final frame after release re-renders smooth.
+        transform_mode = (
+            Qt.FastTransformation
+            if (self._live_preview or self._drawing_bbox)
+            else Qt.SmoothTransformation
+        )
         pix = QPixmap.fromImage(
             snippet.scaled(
                 self._magnifier.width(),
                 self._magnifier.height(),
                 Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
+                transform_mode,
             )
         )
-        painter = QPainter(pix)
-        painter.setRenderHint(QPainter.Antialiasing)
-        class_label = label or self._points.get(self._selected_point_id, {}).get("class")
-        color = QColor(LANDMARK_COLORS.get(class_label, "#4DA3FF"))
         width_scale = pix.width() / rect.width()
         height_scale = pix.height() / rect.height()
         center_x = (scene_pos.x() - rect.left()) * width_scale
         center_y = (scene_pos.y() - rect.top()) * height_scale
         scaled_radius = max(width_scale, height_scale) * ((radius or LandmarkPointItem.DEFAULT_RADIUS) + 3)
-        painter.setPen(QPen(QColor("#000000"), 5))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(QPointF(center_x, center_y), scaled_radius, scaled_radius)
-        painter.setPen(QPen(color, 3))
-        painter.drawEllipse(QPointF(center_x, center_y), scaled_radius - 3, scaled_radius - 3)
+        # The two-ring highlight is antialiased once per (class, radius)
+        # into a cached pixmap and composited here as a plain blit instead
+        # of re-rasterizing two AA ellipses per refresh.
+        ring = self._ring_pixmap(class_label, int(round(scaled_radius)))
+        painter = QPainter(pix)
+        painter.drawPixmap(
+            int(center_x) - ring.width() // 2, int(center_y) - ring.height() // 2, ring
+        )
         painter.end()
         self._magnifier.setPixmap(pix)
+        self._magnifier_cache_key = key
         self._position_magnifier()
         self._magnifier.show()
 
+    def _ring_pixmap(self, class_label: str | None, scaled_radius: int) -> QPixmap:
+        key = (class_label, scaled_radius)
+        pix = self._ring_cache.get(key)
+        if pix is None:
+            size = 2 * (scaled_radius + 3)
+            pix = QPixmap(size, size)
+            pix.fill(Qt.transparent)
+            painter = QPainter(pix)
+            painter.setRenderHint(QPainter.Antialiasing)
+            center = QPointF(size / 2, size / 2)
+            painter.setPen(QPen(QColor("#000000"), 5))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(center, scaled_radius, scaled_radius)
+            painter.setPen(QPen(class_color(class_label), 3))
+            painter.drawEllipse(center, scaled_radius - 3, scaled_radius - 3)
+            painter.end()
+            self._ring_cache[key] = pix
+        return pix
+
     def _update_magnifier_from_selection(self) -> None:
         if self._selected_point_id and self._selected_point_id in self._point_items:
             item = self._point_items[self._selected_point_id]
             self._update_magnifier(
                 item.pos(),
-                self._points.get(self._selected_point_id, {}).get("class"),
+                self._point_class(self._selected_point_id),
                 item.radius(),
             )
 
     def _hide_magnifier(self) -> None:
         self._magnifier.hide()
+        self._magnifier_cache_key = None
 
     def event(self, event) -> bool:  # type: ignore[override]
         if event.type() == QEvent.Gesture:
@@ -1082,20 +1724,28 @@ class ImageCanvas(QGraphicsView):
     def _handle_gesture(self, event: QGestureEvent) -> bool:
         pinch = event.gesture(Qt.PinchGesture)
         if pinch is not None:
-            factor = pinch.scaleFactor()
-            self._set_zoom(self._zoom_factor * factor, centered=False)
+            self._queue_zoom(pinch.scaleFactor())
             return True
         return False
 
-    def _auto_enhance_channels(self, rgb: np.ndarray) -> np.ndarray:
-        reshaped = rgb.reshape(-1, 3)
-        min_vals = reshaped.min(axis=0)
-        max_vals = reshaped.max(axis=0)
-        denom = np.maximum(max_vals - min_vals, 1e-3)
-        enhanced = (rgb - min_vals) / denom * 255.0
-        return np.clip(enhanced, 0, 255)
+    def _auto_enhance_stats(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per-channel (offset, scale) for the contrast stretch.
+
+        Channel stats depend only on the source image, so compute them
+        once per load instead of on every slider tick.
+        """
+        if self._auto_enhance_params is None:
+            flat = self._original_np[..., :3].reshape(-1, 3)
+            min_vals = flat.min(axis=0).astype(np.float32)
+            denom = np.maximum(flat.max(axis=0).astype(np.float32) - min_vals, 1e-3)
+            self._auto_enhance_params = (min_vals, np.float32(255.0) / denom)
+        return self._auto_enhance_params
 
     def _edge_enhance_channels(self, rgb: np.ndarray) -> np.ndarray:
+        if _EDGE_KERNEL_COMPILED:
+            out = np.empty_like(rgb)
+            _edge_enhance_stencil(rgb, out)
+            return out
         padded = np.pad(rgb, ((1, 1), (1, 1), (0, 0)), mode="reflect")
         center = padded[1:-1, 1:-1]
         neighbors = (
@@ -1112,6 +1762,7 @@ class ImageCanvas(QGraphicsView):
         if event.key() == Qt.Key_Space:
             self._space_held = True
             self.viewport().setCursor(Qt.OpenHandCursor)
+            self._last_hover_cursor = None
             event.accept()
             return
         if event.key() in (Qt.Key_Left, Qt.Key_Right, Qt.Key_Up, Qt.Key_Down):
@@ -1133,9 +1784,14 @@ class ImageCanvas(QGraphicsView):
         # Three-point mode keyboard controls
         if self._mode == CanvasMode.BBOX and self._bbox_draw_mode == BBoxDrawMode.THREE_POINT:
             if event.key() == Qt.Key_Backspace and self._three_point_corners:
-                # Remove last clicked point
+                # Remove last clicked point. Under key auto-repeat the
+                # windowing-system QCursor.pos() round-trip adds up; the
+                # position cached from the last mouse move is equivalent.
                 self._three_point_corners.pop()
-                self._update_three_point_preview(self.mapToScene(self.mapFromGlobal(QCursor.pos())))
+                view_pos = self._last_mouse_view_pos
+                if view_pos is None:
+                    view_pos = self.mapFromGlobal(QCursor.pos())
+                self._update_three_point_preview(self.mapToScene(view_pos))
                 event.accept()
                 return
             elif event.key() == Qt.Key_Escape:
@@ -1175,17 +1831,34 @@ class ImageCanvas(QGraphicsView):
         elif action == apex_action:
             self.add_point_at(scene_pos, "APEX")
 
+    @staticmethod
+    def _resolve_item(item):
+        """Map decorative child items (e.g. bbox handle grips) to their owner."""
+        # type-is comparisons instead of isinstance: these run per mouse
+        # event and none of the item classes are subclassed.
+        while (
+            item is not None
+            and type(item) is not LandmarkPointItem
+            and type(item) is not BoundingBoxItem
+            and type(item) is not BoneLineItem
+            and item.parentItem() is not None
+        ):
+            item = item.parentItem()
+        return item
+
     def _update_hover_cursor(self, pos) -> None:
         if self._panning:
             return
-        item = self.itemAt(pos)
-        if isinstance(item, (LandmarkPointItem, BoundingBoxItem)):
-            # Let the item handle the cursor if it wants, or set a default
-            # BoundingBoxItem handles its own cursor in hoverMoveEvent
-            # LandmarkPointItem also does
-            pass
+        # Items that want a special cursor set their own via
+        # QGraphicsItem.setCursor, which Qt shows in preference to the
+        # viewport cursor — so the per-hover itemAt BSP query here bought
+        # nothing. The viewport fallback depends only on the mode and
+        # whether an image is loaded; cache the last shape and touch the
+        # cursor only on transitions.
+        if self._mode == CanvasMode.BBOX or self.has_image():
+            cursor = Qt.CrossCursor
         else:
-            if self._mode == CanvasMode.BBOX:
-                self.viewport().setCursor(Qt.CrossCursor)
-            else:
-                self.viewport().setCursor(Qt.CrossCursor if self.has_image() else Qt.ArrowCursor)
+            cursor = Qt.ArrowCursor
+        if cursor != self._last_hover_cursor:
+            self._last_hover_cursor = cursor
+            self.viewport().setCursor(cursor)
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+from typing import List, Tuple
+
 from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QPainter, QPen
-from PyQt5.QtWidgets import QGraphicsObject, QMenu
+from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsObject, QMenu
 
 from ...utils.landmarks import LANDMARK_COLORS
 
+# Hex parsing per lookup adds up on event paths; build the whole
+# class -> QColor table once at import.
+_CLASS_QCOLORS = {label: QColor(hex_value) for label, hex_value in LANDMARK_COLORS.items()}
+_DEFAULT_QCOLOR = QColor("#4DA3FF")
+
+
+def class_color(label: str) -> QColor:
+    """Shared QColor for a landmark class; one instance per class."""
+    return _CLASS_QCOLORS.get(label, _DEFAULT_QCOLOR)
+
 
 class LandmarkPointItem(QGraphicsObject):
     """Interactive QGraphics item representing a CEJ or Crest point."""
 
     DEFAULT_RADIUS = 3.0
 
+    # Paint runs every refresh; share the outline pens across all points.
+    _SELECTED_PEN = QPen(QColor("#FFFFFF"), 2)
+    _NORMAL_PEN = QPen(QColor("#1E1E1E"), 1)
+
     moved = pyqtSignal(str, float, float)
     deleteRequested = pyqtSignal(str)
     selected = pyqtSignal(str)
@@ -23,10 +39,15 @@ class LandmarkPointItem(QGraphicsObject):
         self.point_id = point_id
         self.label = label
         self._bounds = bounds
+        self._bounds_tuple = (
+            (bounds.left(), bounds.top(), bounds.right(), bounds.bottom())
+            if bounds is not None
+            else None
+        )
         self._radius = radius if radius is not None else self.DEFAULT_RADIUS
         self._selected = False
         self._dragging = False
-        self._color = QColor(LANDMARK_COLORS.get(label, "#4DA3FF"))
+        self._color = class_color(label)
         self.setZValue(10)
         self.setAcceptHoverEvents(True)
         self.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
@@ -39,9 +60,9 @@ class LandmarkPointItem(QGraphicsObject):
         painter.setRenderHint(QPainter.Antialiasing)
         r = self._radius
         if self._selected:
-            painter.setPen(QPen(QColor("#FFFFFF"), 2))
+            painter.setPen(self._SELECTED_PEN)
         else:
-            painter.setPen(QPen(QColor("#1E1E1E"), 1))
+            painter.setPen(self._NORMAL_PEN)
         painter.setBrush(self._color)
         painter.drawEllipse(QPointF(0, 0), r, r)
 
@@ -53,6 +74,11 @@ class LandmarkPointItem(QGraphicsObject):
 
     def set_bounds(self, bounds: QRectF) -> None:
         self._bounds = bounds
+        self._bounds_tuple = (
+            (bounds.left(), bounds.top(), bounds.right(), bounds.bottom())
+            if bounds is not None
+            else None
+        )
 
     def hoverEnterEvent(self, event) -> None:  # type: ignore[override]
         if not self._dragging:
@@ -92,10 +118,16 @@ class LandmarkPointItem(QGraphicsObject):
         super().mouseReleaseEvent(event)
 
     def _clamp_pos(self, pos: QPointF) -> QPointF:
-        if self._bounds is None:
+        # Bounds are cached as floats in set_bounds; this runs per
+        # mouse move during drags, so skip the QRectF accessor calls.
+        bounds = self._bounds_tuple
+        if bounds is None:
             return pos
-        x = min(max(self._bounds.left(), pos.x()), self._bounds.right())
-        y = min(max(self._bounds.top(), pos.y()), self._bounds.bottom())
+        left, top, right, bottom = bounds
+        x = pos.x()
+        y = pos.y()
+        x = left if x < left else (right if x > right else x)
+        y = top if y < top else (bottom if y > bottom else y)
         return QPointF(x, y)
 
     def contextMenuEvent(self, event) -> None:  # type: ignore[override]
@@ -128,3 +160,53 @@ class LandmarkPointItem(QGraphicsObject):
             self.setOpacity(1.0)
             self.setAcceptedMouseButtons(Qt.LeftButton | Qt.RightButton)
             self.setAcceptHoverEvents(True)
+
+
+class PointsOverlay(QGraphicsItem):
+    """Batched, read-only rendering of every landmark point.
+
+    In bbox and bone modes the points are not interactive, so the
+    per-point items are hidden and this single item paints all of them
+    in one call — the scene walk stays flat no matter how many points
+    exist.
+    """
+
+    _BORDER_PEN = QPen(QColor("#1E1E1E"), 1)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._entries: List[Tuple[float, float, float, QColor]] = []
+        self._rect = QRectF()
+        self.setZValue(10)
+        self.setOpacity(0.4)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setVisible(False)
+
+    def set_entries(
+        self, entries: List[Tuple[float, float, float, QColor]], rect: QRectF
+    ) -> None:
+        """Replace the drawn points with (x, y, radius, color) tuples."""
+        self.prepareGeometryChange()
+        self._entries = entries
+        self._rect = QRectF(rect)
+        self.update()
+
+    def boundingRect(self) -> QRectF:  # type: ignore[override]
+        return self._rect
+
+    def shape(self) -> QPainterPath:  # type: ignore[override]
+        # The default shape is the full bounding rect (the whole image),
+        # which would soak up every itemAt() hit test above the bboxes
+        # and bone lines this overlay sits over. Empty path: hits pass
+        # straight through to the interactive items beneath.
+        return QPainterPath()
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:  # type: ignore[override]
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._BORDER_PEN)
+        current_color = None
+        for x, y, r, color in self._entries:
+            if color is not current_color:
+                painter.setBrush(color)
+                current_color = color
+            painter.drawEllipse(QPointF(x, y), r, r)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import QSignalBlocker, QTimer, Qt, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -30,6 +30,7 @@ class SidePanel(QWidget):
     exportRequested = pyqtSignal()
     jumpRequested = pyqtSignal(int)
     adjustmentsChanged = pyqtSignal(int, int, float)
+    livePreviewChanged = pyqtSignal(bool)
     enhancementToggled = pyqtSignal(bool, bool)
     flagRequested = pyqtSignal()
     modeChanged = pyqtSignal(CanvasMode)
@@ -49,6 +50,37 @@ class SidePanel(QWidget):
 
         self._slider_labels: dict[str, QLabel] = {}
 
+        # Dragging a slider fires valueChanged per tick; emitting
+        # adjustmentsChanged for each one reprocesses the image dozens of
+        # times per second. Coalesce bursts into a single emission.
+        self._adjust_timer = QTimer(self)
+        self._adjust_timer.setSingleShot(True)
+        self._adjust_timer.setInterval(30)
+        self._adjust_timer.timeout.connect(self._flush_adjustments)
+
+        # Last emitted modes; toggled fires for both radios in a group,
+        # so the handlers dedupe against these.
+        self._last_mode = CanvasMode.LANDMARK
+        self._last_draw_mode = BBoxDrawMode.DRAG
+
+        # Skip QLabel.setText when the displayed value is unchanged;
+        # counts rarely move between refreshes and coarse slider scales
+        # map many ticks to the same text.
+        self._last_counts: tuple[int, int, int] | None = None
+        self._last_slider_text: dict[str, str] = {}
+        self._last_emitted_adjustments: tuple[int, int, float] | None = None
+
+        # Mirror of the slider positions kept as plain ints; the flush
+        # path reads these instead of three QSlider.value() round-trips
+        # per emission. Matches the initial values in _init_image_section.
+        self._adj_values = {"Brightness": 0, "Contrast": 0, "Gamma": 100}
+
+        # Label strings for every reachable slider position, formatted
+        # once; the drag path then only indexes instead of running
+        # f-string formatting per tick. Ranges match _init_image_section.
+        self._bc_strs = [str(i) for i in range(-100, 101)]
+        self._gamma_strs = [f"{i / 100:.2f}" for i in range(10, 301)]
+
         # --- Section: File & Nav ---
         self._init_file_nav_section()
 
@@ -63,6 +95,24 @@ class SidePanel(QWidget):
 
         self.main_layout.addStretch(1)
 
+        # Built once; set_controls_enabled runs on every image change.
+        self._toggleable = (
+            self.prev_button,
+            self.next_button,
+            self.jump_button,
+            self.jump_spin,
+            self.export_button,
+            self.brightness_slider,
+            self.contrast_slider,
+            self.gamma_slider,
+            self.auto_enhance_check,
+            self.edge_enhance_check,
+            self.flag_button,
+            self.landmark_mode_radio,
+            self.bone_mode_radio,
+            self.bbox_mode_radio,
+        )
+
     def _init_file_nav_section(self) -> None:
         layout = QVBoxLayout()
         layout.setSpacing(12)
@@ -71,7 +121,7 @@ class SidePanel(QWidget):
         self.open_button = QPushButton("Open Folder")
         self.open_button.setObjectName("PrimaryButton")
         self.open_button.setCursor(Qt.PointingHandCursor)
-        self.open_button.clicked.connect(self.openFolderRequested.emit)
+        self.open_button.clicked.connect(self._fwd_open)
         layout.addWidget(self.open_button)
 
         # File Info Label
@@ -88,16 +138,16 @@ class SidePanel(QWidget):
         self.prev_button = QPushButton("◀")
         self.prev_button.setToolTip("Previous Image (A)")
         self.prev_button.setFixedWidth(40)
-        self.prev_button.clicked.connect(self.prevRequested.emit)
+        self.prev_button.clicked.connect(self._fwd_prev)
 
         self.index_label = QLabel("0 / 0")
         self.index_label.setAlignment(Qt.AlignCenter)
-        self.index_label.setStyleSheet("color: #8E8E93; font-weight: 500;")
+        self.index_label.setObjectName("IndexLabel")
 
         self.next_button = QPushButton("▶")
         self.next_button.setToolTip("Next Image (D)")
         self.next_button.setFixedWidth(40)
-        self.next_button.clicked.connect(self.nextRequested.emit)
+        self.next_button.clicked.connect(self._fwd_next)
 
         nav_layout.addWidget(self.prev_button)
         nav_layout.addWidget(self.index_label, 1)  # Expand label to center
@@ -109,9 +159,11 @@ class SidePanel(QWidget):
         jump_layout.setContentsMargins(0, 4, 0, 0)
 
         jump_label = QLabel("Jump to:")
-        jump_label.setStyleSheet("color: #8E8E93;")
+        jump_label.setObjectName("MutedLabel")
 
         self.jump_spin = QSpinBox()
+        # Emit valueChanged only on commit, not per keystroke.
+        self.jump_spin.setKeyboardTracking(False)
         self.jump_spin.setButtonSymbols(QSpinBox.NoButtons)
         self.jump_spin.setAlignment(Qt.AlignCenter)
         self.jump_spin.setFixedWidth(60)
@@ -150,47 +202,18 @@ class SidePanel(QWidget):
         self.bone_mode_radio.toggled.connect(self._on_mode_changed)
         self.bbox_mode_radio.toggled.connect(self._on_mode_changed)
 
-        # BBox Options Sub-panel
+        # BBox Options Sub-panel. Built lazily on first entry into BBox
+        # mode: a session that never draws boxes skips the combo, radios
+        # and their layouts entirely at startup.
         self.bbox_options_widget = QWidget()
-        bbox_layout = QVBoxLayout(self.bbox_options_widget)
-        bbox_layout.setContentsMargins(12, 4, 0, 0)  # Indent
-        bbox_layout.setSpacing(8)
+        self._bbox_options_layout = QVBoxLayout(self.bbox_options_widget)
+        self._bbox_options_layout.setContentsMargins(12, 4, 0, 0)  # Indent
+        self._bbox_options_layout.setSpacing(8)
 
-        # Filter
-        filter_row = QHBoxLayout()
-        filter_label = QLabel("Show:")
-        self.bbox_filter_combo = QComboBox()
-        self.bbox_filter_combo.addItem("All")
-        self.bbox_filter_combo.addItems(BBOX_CLASSES)
-        self.bbox_filter_combo.currentTextChanged.connect(self.bboxFilterChanged.emit)
-        filter_row.addWidget(filter_label)
-        filter_row.addWidget(self.bbox_filter_combo)
-        bbox_layout.addLayout(filter_row)
-
-        # Draw Mode
-        draw_label = QLabel("Method:")
-        bbox_layout.addWidget(draw_label)
-
-        self.bbox_draw_mode_group = QButtonGroup()
-        draw_mode_row = QHBoxLayout()
-        self.bbox_drag_radio = QRadioButton("Drag")
-        self.bbox_three_point_radio = QRadioButton("3-Point")
-        self.bbox_drag_radio.setChecked(True)
-        self.bbox_draw_mode_group.addButton(self.bbox_drag_radio)
-        self.bbox_draw_mode_group.addButton(self.bbox_three_point_radio)
-
-        self.bbox_drag_radio.toggled.connect(self._on_bbox_draw_mode_changed)
-        self.bbox_three_point_radio.toggled.connect(self._on_bbox_draw_mode_changed)
-
-        draw_mode_row.addWidget(self.bbox_drag_radio)
-        draw_mode_row.addWidget(self.bbox_three_point_radio)
-        draw_mode_row.addStretch(1)
-        bbox_layout.addLayout(draw_mode_row)
-
-        # Initially disabled
-        self.bbox_filter_combo.setEnabled(False)
-        self.bbox_drag_radio.setEnabled(False)
-        self.bbox_three_point_radio.setEnabled(False)
+        self._bbox_built = False
+        self.bbox_filter_combo: QComboBox | None = None
+        self.bbox_drag_radio: QRadioButton | None = None
+        self.bbox_three_point_radio: QRadioButton | None = None
 
         layout.addWidget(self.bbox_options_widget)
 
@@ -230,12 +253,12 @@ class SidePanel(QWidget):
 
         # Actions
         self.export_button = QPushButton("Export Data")
-        self.export_button.clicked.connect(self.exportRequested.emit)
+        self.export_button.clicked.connect(self._fwd_export)
         layout.addWidget(self.export_button)
 
         self.flag_button = QPushButton("Flag Image")
-        self.flag_button.setStyleSheet("color: #FF453A;")  # System Red for destructive/flag action
-        self.flag_button.clicked.connect(self.flagRequested.emit)
+        self.flag_button.setObjectName("FlagButton")
+        self.flag_button.clicked.connect(self._fwd_flag)
         layout.addWidget(self.flag_button)
 
         # Stats Grid
@@ -250,7 +273,7 @@ class SidePanel(QWidget):
         self.bbox_label = QLabel("Objects: 0")
 
         for lbl in (self.cej_label, self.crest_label, self.bbox_label):
-            lbl.setStyleSheet("color: #8E8E93; font-size: 12px;")
+            lbl.setObjectName("StatLabel")
             stats_layout.addWidget(lbl)
 
         layout.addWidget(stats_frame)
@@ -258,9 +281,9 @@ class SidePanel(QWidget):
 
     def _create_separator(self) -> QFrame:
         line = QFrame()
+        line.setObjectName("SidebarSeparator")
         line.setFrameShape(QFrame.HLine)
         line.setFrameShadow(QFrame.Sunken)
-        line.setStyleSheet("background-color: #38383A; max-height: 1px; border: none;")
         return line
 
     def _create_section_header(self, text: str) -> QLabel:
@@ -282,8 +305,8 @@ class SidePanel(QWidget):
         container.setSpacing(8)
 
         label = QLabel(name)
+        label.setObjectName("SliderNameLabel")
         label.setFixedWidth(70)
-        label.setStyleSheet("color: #D0D0D0;")
 
         slider = QSlider(Qt.Horizontal)
         slider.setRange(minimum, maximum)
@@ -292,13 +315,17 @@ class SidePanel(QWidget):
         val_label = QLabel(f"{value * scale:.2f}" if name == "Gamma" else str(value))
         val_label.setFixedWidth(40)
         val_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        val_label.setStyleSheet("color: #8E8E93;")  # Qt QSS does not support font-variant-numeric
+        val_label.setObjectName("MutedLabel")  # Qt QSS does not support font-variant-numeric
 
         self._slider_labels[name] = val_label
 
-        slider.valueChanged.connect(
-            lambda val, lbl=val_label, nm=name, sc=scale: self._on_adjustment_change(lbl, nm, val, sc)
-        )
+        # Metadata lives on the slider itself so one decorated slot can
+        # serve all three sliders via sender() — no per-slider lambda.
+        slider.setProperty("adjName", name)
+        slider.valueChanged.connect(self._on_slider_value)
+        # Let the canvas drop to a half-resolution preview for the drag.
+        slider.sliderPressed.connect(self._on_slider_pressed)
+        slider.sliderReleased.connect(self._on_slider_released)
 
         container.addWidget(label)
         container.addWidget(slider)
@@ -307,40 +334,157 @@ class SidePanel(QWidget):
         parent_layout.addLayout(container)
         return slider
 
-    def _on_adjustment_change(self, label_widget: QLabel, name: str, value: int, scale: float = 1.0) -> None:
+    # Signal-to-signal forwarders. Connecting a button directly to
+    # bound ``signal.emit`` registers a dynamic slot per connection;
+    # these decorated stubs dispatch through the compiled meta path.
+    @pyqtSlot()
+    def _fwd_open(self) -> None:
+        self.openFolderRequested.emit()
+
+    @pyqtSlot()
+    def _fwd_prev(self) -> None:
+        self.prevRequested.emit()
+
+    @pyqtSlot()
+    def _fwd_next(self) -> None:
+        self.nextRequested.emit()
+
+    @pyqtSlot()
+    def _fwd_export(self) -> None:
+        self.exportRequested.emit()
+
+    @pyqtSlot()
+    def _fwd_flag(self) -> None:
+        self.flagRequested.emit()
+
+    @pyqtSlot(str)
+    def _fwd_bbox_filter(self, text: str) -> None:
+        self.bboxFilterChanged.emit(text)
+
+    @pyqtSlot()
+    def _on_slider_pressed(self) -> None:
+        self.livePreviewChanged.emit(True)
+
+    @pyqtSlot()
+    def _on_slider_released(self) -> None:
+        self.livePreviewChanged.emit(False)
+        # Push the final value immediately on release rather than
+        # waiting out the debounce interval.
+        self._flush_adjustments()
+
+    @pyqtSlot(int)
+    def _on_slider_value(self, value: int) -> None:
+        slider = self.sender()
+        name = slider.property("adjName")
+        self._adj_values[name] = value
         if name == "Gamma":
-            label_widget.setText(f"{value * scale:.2f}")
+            text = self._gamma_strs[value - 10]
         else:
-            label_widget.setText(f"{value}")
-
-        self.adjustmentsChanged.emit(
-            self.brightness_slider.value(),
-            self.contrast_slider.value(),
-            self.gamma_slider.value() * 0.01,
-        )
-
-    def _on_mode_changed(self) -> None:
+            text = self._bc_strs[value + 100]
+        if self._last_slider_text.get(name) != text:
+            self._last_slider_text[name] = text
+            self._slider_labels[name].setText(text)
+
+        # Restarting the running timer collapses a burst of intermediate
+        # slider values into one adjustmentsChanged emission.
+        self._adjust_timer.start()
+
+    @pyqtSlot()
+    def _flush_adjustments(self) -> None:
+        self._adjust_timer.stop()
+        adj = self._adj_values
+        values = (adj["Brightness"], adj["Contrast"], adj["Gamma"] * 0.01)
+        # A release right after the debounce timer fired would otherwise
+        # re-emit the identical triple and reprocess the image for nothing.
+        if values == self._last_emitted_adjustments:
+            return
+        self._last_emitted_adjustments = values
+        self.adjustmentsChanged.emit(*values)
+
+    @pyqtSlot(bool)
+    def _on_mode_changed(self, checked: bool) -> None:
+        # Every mode switch toggles two radios (one off, one on); only
+        # the "on" edge carries new state.
+        if not checked:
+            return
         if self.landmark_mode_radio.isChecked():
-            self.modeChanged.emit(CanvasMode.LANDMARK)
-            self._set_bbox_controls_enabled(False)
+            mode = CanvasMode.LANDMARK
         elif self.bone_mode_radio.isChecked():
-            self.modeChanged.emit(CanvasMode.BONE)
-            self._set_bbox_controls_enabled(False)
+            mode = CanvasMode.BONE
         else:
-            self.modeChanged.emit(CanvasMode.BBOX)
-            self._set_bbox_controls_enabled(True)
+            mode = CanvasMode.BBOX
+        if mode == self._last_mode:
+            return
+        self._last_mode = mode
+        self.modeChanged.emit(mode)
+        self._set_bbox_controls_enabled(mode == CanvasMode.BBOX)
+
+    def _ensure_bbox_section_built(self) -> None:
+        if self._bbox_built:
+            return
+        self._bbox_built = True
+        bbox_layout = self._bbox_options_layout
+
+        # Filter
+        filter_row = QHBoxLayout()
+        filter_label = QLabel("Show:")
+        self.bbox_filter_combo = QComboBox()
+        self.bbox_filter_combo.addItem("All")
+        self.bbox_filter_combo.addItems(BBOX_CLASSES)
+        self.bbox_filter_combo.currentTextChanged.connect(self._fwd_bbox_filter)
+        filter_row.addWidget(filter_label)
+        filter_row.addWidget(self.bbox_filter_combo)
+        bbox_layout.addLayout(filter_row)
+
+        # Draw Mode
+        draw_label = QLabel("Method:")
+        bbox_layout.addWidget(draw_label)
+
+        self.bbox_draw_mode_group = QButtonGroup()
+        draw_mode_row = QHBoxLayout()
+        self.bbox_drag_radio = QRadioButton("Drag")
+        self.bbox_three_point_radio = QRadioButton("3-Point")
+        self.bbox_drag_radio.setChecked(True)
+        self.bbox_draw_mode_group.addButton(self.bbox_drag_radio)
+        self.bbox_draw_mode_group.addButton(self.bbox_three_point_radio)
+
+        self.bbox_drag_radio.toggled.connect(self._on_bbox_draw_mode_changed)
+        self.bbox_three_point_radio.toggled.connect(self._on_bbox_draw_mode_changed)
+
+        draw_mode_row.addWidget(self.bbox_drag_radio)
+        draw_mode_row.addWidget(self.bbox_three_point_radio)
+        draw_mode_row.addStretch(1)
+        bbox_layout.addLayout(draw_mode_row)
+
+        self._bbox_mode_widgets = (
+            self.bbox_filter_combo,
+            self.bbox_drag_radio,
+            self.bbox_three_point_radio,
+        )
 
     def _set_bbox_controls_enabled(self, enabled: bool) -> None:
-        self.bbox_filter_combo.setEnabled(enabled)
-        self.bbox_drag_radio.setEnabled(enabled)
-        self.bbox_three_point_radio.setEnabled(enabled)
+        if enabled:
+            self._ensure_bbox_section_built()
+        elif not self._bbox_built:
+            # Nothing to disable until the section exists.
+            return
+        for widget in self._bbox_mode_widgets:
+            widget.setEnabled(enabled)
 
-    def _on_bbox_draw_mode_changed(self) -> None:
+    @pyqtSlot(bool)
+    def _on_bbox_draw_mode_changed(self, checked: bool) -> None:
+        if not checked:
+            return
         if self.bbox_drag_radio.isChecked():
-            self.bboxDrawModeChanged.emit(BBoxDrawMode.DRAG)
+            draw_mode = BBoxDrawMode.DRAG
         else:
-            self.bboxDrawModeChanged.emit(BBoxDrawMode.THREE_POINT)
+            draw_mode = BBoxDrawMode.THREE_POINT
+        if draw_mode == self._last_draw_mode:
+            return
+        self._last_draw_mode = draw_mode
+        self.bboxDrawModeChanged.emit(draw_mode)
 
+    @pyqtSlot()
     def _emit_jump(self) -> None:
         total = self.jump_spin.maximum()
         if total <= 0:
@@ -357,71 +501,74 @@ class SidePanel(QWidget):
             self.index_label.setText(f"{index + 1} / {total}")
 
         self.jump_spin.setMaximum(max(1, total))
-        if total == 0:
-            self.jump_spin.setValue(1)
-        else:
-            self.jump_spin.setValue(index + 1)
+        target = 1 if total == 0 else index + 1
+        # setValue on an unchanged spinbox still re-runs its internal
+        # validation and valueChanged machinery.
+        if self.jump_spin.value() != target:
+            self.jump_spin.setValue(target)
 
     def set_counts(self, cej: int, crest: int, bboxes: int) -> None:
-        self.cej_label.setText(f"CEJ Points: {cej}")
-        self.crest_label.setText(f"Crest Points: {crest}")
-        self.bbox_label.setText(f"Objects: {bboxes}")
+        last = self._last_counts
+        if last == (cej, crest, bboxes):
+            return
+        if last is None or cej != last[0]:
+            self.cej_label.setText(f"CEJ Points: {cej}")
+        if last is None or crest != last[1]:
+            self.crest_label.setText(f"Crest Points: {crest}")
+        if last is None or bboxes != last[2]:
+            self.bbox_label.setText(f"Objects: {bboxes}")
+        self._last_counts = (cej, crest, bboxes)
 
     def set_adjustments(self, brightness: int, contrast: int, gamma: float) -> None:
-        self.brightness_slider.blockSignals(True)
-        self.contrast_slider.blockSignals(True)
-        self.gamma_slider.blockSignals(True)
-
-        self.brightness_slider.setValue(brightness)
-        self.contrast_slider.setValue(contrast)
-        self.gamma_slider.setValue(int(gamma * 100))
-
-        self.brightness_slider.blockSignals(False)
-        self.contrast_slider.blockSignals(False)
-        self.gamma_slider.blockSignals(False)
-
-        self._slider_labels["Brightness"].setText(f"{brightness}")
-        self._slider_labels["Contrast"].setText(f"{contrast}")
-        self._slider_labels["Gamma"].setText(f"{gamma:.2f}")
+        self.setUpdatesEnabled(False)
+        try:
+            # One binding crossing per widget instead of a
+            # block/unblock pair, with exception-safe restore.
+            with QSignalBlocker(self.brightness_slider), QSignalBlocker(
+                self.contrast_slider
+            ), QSignalBlocker(self.gamma_slider):
+                self.brightness_slider.setValue(brightness)
+                self.contrast_slider.setValue(contrast)
+                self.gamma_slider.setValue(int(gamma * 100))
+
+            self._adj_values["Brightness"] = brightness
+            self._adj_values["Contrast"] = contrast
+            self._adj_values["Gamma"] = int(gamma * 100)
+
+            for name, text in (
+                ("Brightness", f"{brightness}"),
+                ("Contrast", f"{contrast}"),
+                ("Gamma", f"{gamma:.2f}"),
+            ):
+                if self._last_slider_text.get(name) != text:
+                    self._last_slider_text[name] = text
+                    self._slider_labels[name].setText(text)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def set_enhancement_state(self, auto_enhance: bool, edge_enhance: bool) -> None:
-        self.auto_enhance_check.blockSignals(True)
-        self.edge_enhance_check.blockSignals(True)
-
-        self.auto_enhance_check.setChecked(auto_enhance)
-        self.edge_enhance_check.setChecked(edge_enhance)
-
-        self.auto_enhance_check.blockSignals(False)
-        self.edge_enhance_check.blockSignals(False)
+        with QSignalBlocker(self.auto_enhance_check), QSignalBlocker(self.edge_enhance_check):
+            self.auto_enhance_check.setChecked(auto_enhance)
+            self.edge_enhance_check.setChecked(edge_enhance)
 
+    @pyqtSlot()
     def _emit_enhancements(self) -> None:
         self.enhancementToggled.emit(self.auto_enhance_check.isChecked(), self.edge_enhance_check.isChecked())
 
     def set_controls_enabled(self, enabled: bool) -> None:
-        # General controls
-        for widget in (
-            self.prev_button,
-            self.next_button,
-            self.jump_button,
-            self.jump_spin,
-            self.export_button,
-            self.brightness_slider,
-            self.contrast_slider,
-            self.gamma_slider,
-            self.auto_enhance_check,
-            self.edge_enhance_check,
-            self.flag_button,
-            self.landmark_mode_radio,
-            self.bone_mode_radio,
-            self.bbox_mode_radio,
-        ):
-            widget.setEnabled(enabled)
-
-        # Mode-specific controls state
-        if enabled and self.bbox_mode_radio.isChecked():
-            self._set_bbox_controls_enabled(True)
-        else:
-            self._set_bbox_controls_enabled(False)
+        # Each setEnabled can trigger a style recalc and repaint; freeze
+        # painting so the whole pass collapses into one update.
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in self._toggleable:
+                widget.setEnabled(enabled)
+
+            # Mode-specific controls state
+            self._set_bbox_controls_enabled(enabled and self.bbox_mode_radio.isChecked())
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def set_navigation_state(self, has_prev: bool, has_next: bool) -> None:
         self.prev_button.setEnabled(has_prev)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import os
 import shutil
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional
 
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import QEvent, QObject, QRunnable, QThread, QThreadPool, Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QImage, QKeySequence, QPixmapCache
 from PyQt5.QtWidgets import (
     QAbstractSpinBox,
     QAction,
+    QApplication,
     QFileDialog,
     QHBoxLayout,
     QLabel,
@@ -16,7 +19,6 @@ from PyQt5.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPlainTextEdit,
-    QShortcut,
     QStatusBar,
     QTextEdit,
     QWidget,
@@ -28,21 +30,100 @@ from ..canvas.image_canvas import ImageCanvas
 from ..sidebar.panel import SidePanel
 
 
+# Platform key-string variants for zoom, defined once; QKeySequence parses
+# each string when the key map is built.
+_ZOOM_IN_STRS = ("Ctrl++", "Ctrl+=", "Meta++", "Meta+=", "Ctrl+Plus", "Meta+Plus")
+_ZOOM_OUT_STRS = ("Ctrl+-", "Ctrl+_", "Meta+-", "Meta+_", "Ctrl+Minus", "Meta+Minus")
+
+
+class _ImageLoadSignals(QObject):
+    """Completion signals for ImageLoadTask (QRunnable cannot emit)."""
+
+    loaded = pyqtSignal(int, int, str, QImage)
+    failed = pyqtSignal(int, str, str)
+
+
+class ImageLoadTask(QRunnable):
+    """Decodes one image on a pool thread.
+
+    Emits ``loaded(seq, index, file_name, image)`` or
+    ``failed(seq, file_name, message)``; the sequence token lets the
+    window discard results that arrive after the user navigated on.
+    """
+
+    def __init__(self, seq: int, index: int, file_name: str, path: str) -> None:
+        super().__init__()
+        self.signals = _ImageLoadSignals()
+        self._seq = seq
+        self._index = index
+        self._file_name = file_name
+        self._path = path
+
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            image = ImageCanvas.decode_image(self._path)
+        except ValueError as exc:
+            self.signals.failed.emit(self._seq, self._file_name, str(exc))
+            return
+        self.signals.loaded.emit(self._seq, self._index, self._file_name, image)
+
+
+class _SaveWorker(QObject):
+    """Writes annotation records to disk from a dedicated thread.
+
+    Lives in the window's save QThread; requests arrive through a queued
+    signal so only the JSON serialize and file replace leave the GUI
+    thread — the record itself is built on the main thread.
+    """
+
+    saveCompleted = pyqtSignal(str)
+
+    def __init__(self, manager: AnnotationManager) -> None:
+        super().__init__()
+        self._manager = manager
+
+    @pyqtSlot(object)
+    def save(self, record: AnnotationRecord) -> None:
+        self._manager.save(record)
+        self.saveCompleted.emit(record.file_name)
+
+
 class AnnotationMainWindow(QMainWindow):
     """Top-level window orchestrating the sidebar, canvas, and autosave logic."""
 
+    _saveRequested = pyqtSignal(object)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Bitewing Landmark Annotator")
         self.resize(1280, 800)
         self.setStyleSheet(load_stylesheet())
 
+        # The canvas items render through DeviceCoordinateCache, which
+        # stores its rasterized pixmaps in the global QPixmapCache; the
+        # 10 MB default evicts constantly at radiograph sizes.
+        QPixmapCache.setCacheLimit(512 * 1024)  # KB
+
         self.annotation_manager = AnnotationManager()
         self.image_files: List[str] = []
+        # (name, image path, annotation path) per file, computed once at
+        # folder load so navigation does no per-step Path arithmetic.
+        self._image_records: List[tuple[str, Path, Path]] = []
         self.current_index = -1
         self.current_dimensions = (0, 0)
-        self._pending_points: Optional[List[dict]] = None
-        self._pending_bboxes: Optional[List[dict]] = None
+        # The record for the image on screen. Edit slots write into it
+        # directly, so every autosave reuses this one object instead of
+        # allocating a fresh record (and SoA mirrors) per save.
+        self._live_record: Optional[AnnotationRecord] = None
+        # Decodes run on the global pool so Prev/Next never block the
+        # event loop; the token identifies the newest request.
+        self._thread_pool = QThreadPool.globalInstance()
+        self._load_seq = 0
+        # Decoded images for recently visited files plus prefetched
+        # neighbours; linear walks and one-step backtracking hit this
+        # instead of re-decoding the JPEG.
+        self._image_cache: "OrderedDict[str, QImage]" = OrderedDict()
+        self._cache_limit = 8
 
         self.canvas = ImageCanvas()
         self.sidebar = SidePanel()
@@ -64,6 +145,17 @@ class AnnotationMainWindow(QMainWindow):
         self._autosave_timer.setSingleShot(True)
         self._autosave_timer.timeout.connect(self._perform_autosave)
 
+        # Disk writes run on a persistent worker thread; the queued
+        # signal hop keeps JSON serialization and the file replace off
+        # the GUI thread.
+        self._last_saved_hash: Optional[int] = None
+        self._save_thread = QThread(self)
+        self._save_worker = _SaveWorker(self.annotation_manager)
+        self._save_worker.moveToThread(self._save_thread)
+        self._saveRequested.connect(self._save_worker.save)
+        self._save_worker.saveCompleted.connect(self._on_save_completed)
+        self._save_thread.start()
+
         self.sidebar.openFolderRequested.connect(self.open_folder)
         self.sidebar.prevRequested.connect(self.show_previous_image)
         self.sidebar.nextRequested.connect(self.show_next_image)
@@ -80,6 +172,7 @@ class AnnotationMainWindow(QMainWindow):
         self.canvas.countsChanged.connect(self.sidebar.set_counts)
         self.canvas.zoomChanged.connect(self._update_zoom_label)
         self.sidebar.adjustmentsChanged.connect(self._on_adjustments_changed)
+        self.sidebar.livePreviewChanged.connect(self.canvas.set_live_preview)
         self.sidebar.enhancementToggled.connect(self._on_enhancement_toggled)
 
         self.sidebar.set_controls_enabled(False)
@@ -89,7 +182,6 @@ class AnnotationMainWindow(QMainWindow):
         self._current_gamma = 1.0
         self._auto_enhance = False
         self._edge_enhance = False
-        self._pending_bone_lines: Optional[List[List[dict]]] = None
 
     def _build_menu(self) -> None:
         file_menu = self.menuBar().addMenu("&File")
@@ -118,31 +210,87 @@ class AnnotationMainWindow(QMainWindow):
         status.setSizeGripEnabled(False)
         self.zoom_label = QLabel("Zoom: 100%")
         self.autosave_label = QLabel("Saved ✓")
-        self.autosave_label.setStyleSheet("color: #61D0B5;")
+        self.autosave_label.setObjectName("AutosaveLabel")
+        self._autosave_state = ""
+        self._set_autosave_state("saved", "Saved ✓")
         status.addPermanentWidget(self.zoom_label)
         status.addPermanentWidget(self.autosave_label)
         self.setStatusBar(status)
 
+    def _set_autosave_state(self, state: str, text: str) -> None:
+        """Updates the autosave indicator; colors come from the QSS
+        [state=...] rules, so only a repolish runs on transitions."""
+        label = self.autosave_label
+        if state != self._autosave_state:
+            self._autosave_state = state
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+        if label.text() != text:
+            label.setText(text)
+
     def _build_shortcuts(self) -> None:
-        QShortcut(
-            QKeySequence(Qt.Key_A),
-            self,
-            activated=lambda: self._navigate_if_allowed(self.show_previous_image, allow_with_selection=True),
-        )
-        QShortcut(
-            QKeySequence(Qt.Key_D),
-            self,
-            activated=lambda: self._navigate_if_allowed(self.show_next_image, allow_with_selection=True),
-        )
-        QShortcut(QKeySequence(Qt.Key_Escape), self, activated=self.canvas.clear_selection)
-        QShortcut(QKeySequence.ZoomIn, self, activated=self.canvas.zoom_in)
-        QShortcut(QKeySequence.ZoomOut, self, activated=self.canvas.zoom_out)
-        for seq in ("Ctrl++", "Ctrl+=", "Meta++", "Meta+=", "Ctrl+Plus", "Meta+Plus"):
-            QShortcut(QKeySequence(seq), self, activated=self.canvas.zoom_in)
-        for seq in ("Ctrl+-", "Ctrl+_", "Meta+-", "Meta+_", "Ctrl+Minus", "Meta+Minus"):
-            QShortcut(QKeySequence(seq), self, activated=self.canvas.zoom_out)
-        QShortcut(QKeySequence(Qt.Key_Delete), self, activated=self.canvas.delete_selected_item)
-        QShortcut(QKeySequence(Qt.Key_Backspace), self, activated=self.canvas.delete_selected_item)
+        # Single dict consulted from eventFilter instead of one QShortcut
+        # per binding: every QShortcut registers with the application's
+        # shortcut map and adds a sequence-matching pass to each
+        # keypress, while the dict resolves a binding in one lookup.
+        # Menu shortcuts (Ctrl+O/S/E) stay on their QActions so the menu
+        # keeps showing them.
+        bindings = [
+            (QKeySequence(Qt.Key_A), self._shortcut_prev),
+            (QKeySequence(Qt.Key_D), self._shortcut_next),
+            (QKeySequence(Qt.Key_Escape), self.canvas.clear_selection),
+            (QKeySequence(Qt.Key_Delete), self.canvas.delete_selected_item),
+            (QKeySequence(Qt.Key_Backspace), self.canvas.delete_selected_item),
+        ]
+        for standard, strs, slot in (
+            (QKeySequence.ZoomIn, _ZOOM_IN_STRS, self.canvas.zoom_in),
+            (QKeySequence.ZoomOut, _ZOOM_OUT_STRS, self.canvas.zoom_out),
+        ):
+            for seq in QKeySequence.keyBindings(standard):
+                bindings.append((seq, slot))
+            for text in strs:
+                bindings.append((QKeySequence(text), slot))
+        # seq[0] packs key and modifiers into one int, matching the
+        # key | modifiers code computed in eventFilter.
+        self._key_map = {seq[0]: slot for seq, slot in bindings if not seq.isEmpty()}
+        QApplication.instance().installEventFilter(self)
+
+    def _shortcut_prev(self) -> None:
+        self._navigate_if_allowed(self.show_previous_image, allow_with_selection=True)
+
+    def _shortcut_next(self) -> None:
+        self._navigate_if_allowed(self.show_next_image, allow_with_selection=True)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if event.type() == QEvent.KeyPress and self.isActiveWindow():
+            # Qt suppressed QShortcuts while a popup was open; mirror
+            # that, so Escape closes a context menu instead of clearing
+            # the selection (and A/D/Delete don't act under a live menu).
+            if QApplication.activePopupWidget() is not None:
+                return super().eventFilter(obj, event)
+            key = event.key()
+            if key not in (Qt.Key_Control, Qt.Key_Shift, Qt.Key_Alt, Qt.Key_Meta):
+                mods = int(event.modifiers())
+                slot = self._key_map.get(key | mods)
+                if slot is None and mods & Qt.ShiftModifier:
+                    # "Ctrl++" arrives as Ctrl+Shift+= on many layouts.
+                    # Only retry combos that keep Ctrl/Meta after the
+                    # strip, so Shift+A or Shift+Delete never match the
+                    # unmodified bindings.
+                    stripped = mods & ~int(Qt.ShiftModifier)
+                    if stripped & int(Qt.ControlModifier | Qt.MetaModifier):
+                        slot = self._key_map.get(key | stripped)
+                if slot is not None:
+                    # Unmodified keys in a text field are typing, not
+                    # shortcuts (A/D, Delete, Backspace stay editable).
+                    focus = QApplication.focusWidget()
+                    if mods & int(Qt.ControlModifier | Qt.MetaModifier) or not isinstance(
+                        focus, (QLineEdit, QTextEdit, QPlainTextEdit, QAbstractSpinBox)
+                    ):
+                        slot()
+                        return True
+        return super().eventFilter(obj, event)
 
     def open_folder(self) -> None:
         directory = QFileDialog.getExistingDirectory(self, "Select Data Folder")
@@ -157,15 +305,22 @@ class AnnotationMainWindow(QMainWindow):
             QMessageBox.warning(self, "Folder Not Found", "The selected folder could not be opened.")
             return
         self.image_files = files
+        image_dir = self.annotation_manager.image_dir
+        self._image_records = [
+            (name, image_dir / name, self.annotation_manager.annotation_path(name))
+            for name in files
+        ]
+        self._image_cache.clear()
         if not files:
             QMessageBox.information(self, "No Images", "The selected folder does not contain supported images.")
             self.current_index = -1
+            self._autosave_timer.stop()
+            self._live_record = None
             self.canvas.clear()
             self.sidebar.set_controls_enabled(False)
             self.sidebar.set_navigation_state(False, False)
             self.sidebar.set_file_info("", 0, 0)
-            self.autosave_label.setText("Idle")
-            self.autosave_label.setStyleSheet("color: #9A9A9A;")
+            self._set_autosave_state("idle", "Idle")
             return
         self.sidebar.set_controls_enabled(True)
         self._autosave_timer.stop()
@@ -175,13 +330,26 @@ class AnnotationMainWindow(QMainWindow):
         if not (0 <= index < len(self.image_files)):
             return
         assert self.annotation_manager.image_dir is not None
-        file_name = self.image_files[index]
-        image_path = str(self.annotation_manager.image_dir / file_name)
-        try:
-            width, height = self.canvas.load_image(image_path)
-        except ValueError as exc:
-            QMessageBox.critical(self, "Load Error", str(exc))
+        file_name, image_path, _ = self._image_records[index]
+        self._load_seq += 1
+        cached = self._image_cache.get(file_name)
+        if cached is not None:
+            self._image_cache.move_to_end(file_name)
+            self._on_image_decoded(self._load_seq, index, file_name, cached)
+            return
+        task = ImageLoadTask(self._load_seq, index, file_name, str(image_path))
+        task.signals.loaded.connect(self._on_image_decoded)
+        task.signals.failed.connect(self._on_image_load_failed)
+        self._thread_pool.start(task, 1)
+
+    def _on_image_decoded(self, seq: int, index: int, file_name: str, image: QImage) -> None:
+        # Cache even stale or prefetched decodes — the work is done and
+        # the user is likely heading this way.
+        self._cache_put(file_name, image)
+        if seq != self._load_seq:
+            # The user navigated again before this decode finished.
             return
+        width, height = self.canvas.apply_decoded_image(image)
         self.canvas.set_adjustments(self._current_brightness, self._current_contrast, self._current_gamma)
         self.canvas.set_enhancements(self._auto_enhance, self._edge_enhance)
         record = self.annotation_manager.load(file_name, width, height)
@@ -193,53 +361,104 @@ class AnnotationMainWindow(QMainWindow):
         self.canvas.set_bone_lines(record.bone_lines)
         self.sidebar.set_file_info(file_name, index, len(self.image_files))
         self.sidebar.set_navigation_state(index > 0, index < len(self.image_files) - 1)
-        self._pending_points = record.points
-        self._pending_bboxes = record.bboxes
-        self._pending_bone_lines = record.bone_lines
-        self.autosave_label.setText("Saved ✓")
-        self.autosave_label.setStyleSheet("color: #61D0B5;")
+        self._live_record = record
+        self._set_autosave_state("saved", "Saved ✓")
         self.setWindowTitle(f"Bitewing Landmark Annotator — {file_name}")
         self.sidebar.set_adjustments(self._current_brightness, self._current_contrast, self._current_gamma)
         self.sidebar.set_enhancement_state(self._auto_enhance, self._edge_enhance)
+        self._schedule_prefetch(index)
+
+    def _on_image_load_failed(self, seq: int, file_name: str, message: str) -> None:
+        if seq != self._load_seq:
+            return
+        QMessageBox.critical(self, "Load Error", message)
+
+    def _cache_put(self, file_name: str, image: QImage) -> None:
+        cache = self._image_cache
+        cache[file_name] = image
+        cache.move_to_end(file_name)
+        while len(cache) > self._cache_limit:
+            cache.popitem(last=False)
+
+    def _schedule_prefetch(self, index: int) -> None:
+        """Decode the neighbouring images in the background.
+
+        Prefetch tasks carry sequence 0, which never matches a live
+        request, so their results land in the cache without touching the
+        canvas.
+        """
+        if self.annotation_manager.image_dir is None:
+            return
+        for neighbor in (index + 1, index - 1):
+            if not (0 <= neighbor < len(self.image_files)):
+                continue
+            name, path, _ = self._image_records[neighbor]
+            if name in self._image_cache:
+                continue
+            task = ImageLoadTask(0, neighbor, name, str(path))
+            task.signals.loaded.connect(self._on_image_decoded)
+            self._thread_pool.start(task, 0)
 
     def _on_points_updated(self, points: List[dict]) -> None:
-        if self.current_index == -1:
+        if self._live_record is None:
             return
-        self._pending_points = points
+        # set_points also refreshes the record's SoA mirrors, which the
+        # exporter reads straight from the manager cache.
+        self._live_record.set_points(points)
         self._trigger_autosave()
 
     def _on_bboxes_updated(self, bboxes: List[dict]) -> None:
-        if self.current_index == -1:
+        if self._live_record is None:
             return
-        self._pending_bboxes = bboxes
+        self._live_record.bboxes = bboxes
         self._trigger_autosave()
-        
+
     def _on_bone_lines_updated(self, bone_lines: List[List[dict]]) -> None:
-        if self.current_index == -1:
+        if self._live_record is None:
             return
-        self._pending_bone_lines = bone_lines
+        self._live_record.bone_lines = bone_lines
         self._trigger_autosave()
 
     def _trigger_autosave(self) -> None:
-        self.autosave_label.setText("Saving…")
-        self.autosave_label.setStyleSheet("color: #F2C76E;")
+        self._set_autosave_state("saving", "Saving…")
         self._autosave_timer.start()
 
     def _perform_autosave(self) -> None:
-        if self.current_index == -1 or self._pending_points is None:
+        record = self._live_record
+        if record is None:
             return
-        file_name = self.image_files[self.current_index]
-        record = AnnotationRecord(
-            file_name=file_name,
-            width=self.current_dimensions[0],
-            height=self.current_dimensions[1],
-            points=self._pending_points,
-            bboxes=self._pending_bboxes if self._pending_bboxes is not None else [],
-            bone_lines=self._pending_bone_lines if self._pending_bone_lines is not None else [],
+        # Repeated triggers with identical state (e.g. a point dragged
+        # back to its start) would stack byte-identical writes.
+        state_hash = hash(
+            (record.file_name, repr(record.points), repr(record.bboxes), repr(record.bone_lines))
         )
-        self.annotation_manager.save(record)
-        self.autosave_label.setText("Saved ✓")
-        self.autosave_label.setStyleSheet("color: #61D0B5;")
+        if state_hash == self._last_saved_hash:
+            self._set_autosave_state("saved", "Saved ✓")
+            return
+        self._last_saved_hash = state_hash
+        # Sharing the record with the worker is safe: edits rebind its
+        # fields to freshly built lists (the canvas never mutates an
+        # emitted list), so an in-flight serialize reads coherent lists,
+        # and any cross-field mix is overwritten by the follow-up save
+        # already queued behind it.
+        self._saveRequested.emit(record)
+
+    def _on_save_completed(self, file_name: str) -> None:
+        self._set_autosave_state("saved", "Saved ✓")
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._autosave_timer.stop()
+        # Stop the worker first: queued save requests still pending when
+        # quit() is processed are not guaranteed delivery, while a save
+        # already running finishes before the thread exits.
+        self._save_thread.quit()
+        self._save_thread.wait(2000)
+        # With the worker stopped, write the final state synchronously —
+        # this is the save carrying whatever the user edited last, and
+        # it must not race a worker write to the same file.
+        if self._live_record is not None:
+            self.annotation_manager.save(self._live_record)
+        super().closeEvent(event)
 
     def save_current_image(self) -> None:
         self._autosave_timer.stop()
@@ -275,8 +494,7 @@ class AnnotationMainWindow(QMainWindow):
         if self.current_index == -1 or self.annotation_manager.image_dir is None:
             QMessageBox.information(self, "No Image", "Load an image before flagging.")
             return
-        file_name = self.image_files[self.current_index]
-        src_image = self.annotation_manager.image_dir / file_name
+        file_name, src_image, ann_path = self._image_records[self.current_index]
         if not src_image.exists():
             QMessageBox.warning(self, "Missing File", f"Image {file_name} could not be found.")
             return
@@ -284,17 +502,28 @@ class AnnotationMainWindow(QMainWindow):
         flagged_dir.mkdir(parents=True, exist_ok=True)
         dest_image = flagged_dir / file_name
         try:
-            shutil.move(str(src_image), str(dest_image))
+            self._move_file(src_image, dest_image)
         except Exception as exc:  # noqa: BLE001
             QMessageBox.critical(self, "Flag Failed", f"Unable to move image:\n{exc}")
             return
-        ann_path = self.annotation_manager.annotation_path(file_name)
         if ann_path.exists():
             dest_ann_dir = flagged_dir / "annotations"
             dest_ann_dir.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(ann_path), str(dest_ann_dir / ann_path.name))
+            try:
+                self._move_file(ann_path, dest_ann_dir / ann_path.name)
+            except Exception as exc:  # noqa: BLE001
+                # Keep image and annotation together: undo the image move.
+                self._move_file(dest_image, src_image)
+                QMessageBox.critical(self, "Flag Failed", f"Unable to move annotation:\n{exc}")
+                return
+        # A pending autosave tick must not resurrect the flagged file's
+        # annotation; the next image install resets the live record.
+        self._autosave_timer.stop()
+        self._live_record = None
         self.annotation_manager._cache.pop(file_name, None)  # type: ignore[attr-defined]
+        self._image_cache.pop(file_name, None)
         self.image_files.pop(self.current_index)
+        self._image_records.pop(self.current_index)
         if not self.image_files:
             self.current_index = -1
             self.canvas.clear()
@@ -306,6 +535,19 @@ class AnnotationMainWindow(QMainWindow):
         self._load_image_at_index(new_index)
         QMessageBox.information(self, "Flagged", f"{file_name} moved to {flagged_dir}")
 
+    @staticmethod
+    def _move_file(src: Path, dst: Path) -> None:
+        """Moves a file by rename when possible.
+
+        flagged/ lives under the image directory, so os.replace is an
+        atomic metadata operation regardless of file size; shutil.move
+        covers the cross-filesystem case.
+        """
+        try:
+            os.replace(src, dst)
+        except OSError:
+            shutil.move(str(src), str(dst))
+
     def _navigate_if_allowed(self, callback, allow_with_selection: bool = False) -> None:
         focus_widget = self.focusWidget()
         if isinstance(focus_widget, (QLineEdit, QTextEdit, QPlainTextEdit, QAbstractSpinBox)):
@@ -1,11 +1,16 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def load_stylesheet() -> str:
     """
     Loads the application stylesheet from resources/style.qss.
     Returns empty string if file not found.
+
+    The result is memoized for the life of the process; call
+    ``load_stylesheet.cache_clear()`` to pick up edits during development.
     """
     # Determine the directory where theme.py resides (DentAnX/ui)
     current_dir = Path(__file__).parent
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 LANDMARK_CLASSES = ["CEJ", "CREST", "APEX"]
 
+_LANDMARK_SET = frozenset(LANDMARK_CLASSES)
+
 LANDMARK_COLORS = {
     "CEJ": "#4DA3FF",
     "CREST": "#61D0B5",
@@ -11,12 +15,16 @@ LANDMARK_COLORS = {
 }
 
 
+@lru_cache(maxsize=128)
 def normalize_class(label: str) -> str:
     """
     Normalize a landmark class label to uppercase and validate against allowed classes.
+
+    The input alphabet is tiny, so the cache turns the per-point call made
+    during loads and exports into a single dict lookup.
     """
     label = str(label).upper()
-    return label if label in LANDMARK_CLASSES else "CEJ"
+    return label if label in _LANDMARK_SET else "CEJ"
 
 
 BBOX_CLASSES = ["Unlabeled", "Tooth", "Crest", "PDL", "LD"]
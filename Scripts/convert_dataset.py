@@ -2,10 +2,225 @@
 This script converts the dataset from the format used by DentAnX to the format used by YOLOv8.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import json
+import mmap
+import os
 import shutil
-from PIL import Image
+import numpy as np
+
+# orjson parses and serializes several times faster than the stdlib;
+# fall back silently when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Parses JSON bytes with the fastest available backend."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Serializes an object to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Below this size the mmap setup costs more than the read it avoids.
+_MMAP_MIN_BYTES = 16 * 1024
+
+
+def _read_json(path):
+    """
+    Parses a JSON file. Larger files are parsed straight from the page
+    cache via mmap instead of allocating a bytes copy of the whole file;
+    bone-line annotations in particular can run to hundreds of kilobytes.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is not None and size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+        return _loads(f.read())
+
+
+def _fast_copy(src, dst):
+    """
+    Copies src to dst without pushing the bytes through Python. A hardlink
+    is a metadata-only operation when both paths share a filesystem; when
+    linking is not possible (cross-device, unsupported FS, dst exists),
+    falls back to shutil.copyfile, which uses kernel-side copy paths.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+# Dedup tolerance for snapping bone-line endpoints onto CREST points.
+_CREST_TOLERANCE = 2.0
+_CELL = int(_CREST_TOLERANCE)
+
+
+def _sync_crest_endpoints(points_out, bone_lines_out):
+    """Appends bone-line endpoints to points_out as CREST points.
+
+    Endpoints within _CREST_TOLERANCE pixels of an existing CREST point
+    are skipped. CREST points are bucketed into a coarse grid so each
+    endpoint checks only the nine neighbouring cells instead of every
+    point, and distances compare squared to avoid the sqrt.
+    """
+    grid = {}
+
+    def _add_to_grid(x, y):
+        key = (int(x) // _CELL, int(y) // _CELL)
+        grid.setdefault(key, []).append((x, y))
+
+    for existing_pt in points_out:
+        if existing_pt["class"] == "CREST":
+            _add_to_grid(existing_pt["x"], existing_pt["y"])
+
+    tol_sq = _CREST_TOLERANCE * _CREST_TOLERANCE
+    for line in bone_lines_out:
+        if not line:
+            continue
+        for pt in (line[0], line[-1]):
+            x, y = pt["x"], pt["y"]
+            cx, cy = int(x) // _CELL, int(y) // _CELL
+            exists = False
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    for ex, ey in grid.get((gx, gy), ()):
+                        if (ex - x) ** 2 + (ey - y) ** 2 < tol_sq:
+                            exists = True
+                            break
+                    if exists:
+                        break
+                if exists:
+                    break
+            if not exists:
+                points_out.append({"x": x, "y": y, "class": "CREST"})
+                _add_to_grid(x, y)
+
+
+def convert_one(input_json_path, source_img_dir, bone_json_dir, output_dir, annotations_dir):
+    """
+    Converts a single annotation JSON (and copies its image). Returns True on
+    success. Pure per-file work so the files can be processed in parallel.
+    """
+    # Imported here so the script starts (and fails fast on bad paths)
+    # without paying for PIL; after the first call this is a dict lookup.
+    from PIL import Image
+
+    basename = input_json_path.stem
+
+    # Find corresponding image
+    input_img_path = source_img_dir / f"{basename}.jpg"
+    if not input_img_path.exists():
+        # Try other extensions
+        found = False
+        for ext in ['.png', '.jpeg', '.bmp', '.tif', '.tiff']:
+            potential = source_img_dir / f"{basename}{ext}"
+            if potential.exists():
+                input_img_path = potential
+                found = True
+                break
+        if not found:
+            print(f"Warning: Image for {basename} not found. Skipping.")
+            return False
+
+    img_filename = input_img_path.name
+
+    # Copy Image
+    dest_img_path = output_dir / img_filename
+    if dest_img_path.exists():
+        # os.link refuses to overwrite; re-runs land here.
+        dest_img_path.unlink()
+    _fast_copy(input_img_path, dest_img_path)
+
+    # Get Image Dimensions (Image.open reads only the header until the
+    # pixel data is actually requested, so .size never decodes the file)
+    try:
+        with Image.open(input_img_path) as img:
+            width, height = img.size
+    except Exception as e:
+        print(f"Error opening image {input_img_path}: {e}")
+        return False
+
+    # Read Input JSON
+    try:
+        data = _read_json(input_json_path)
+    except Exception as e:
+        print(f"Error reading JSON {input_json_path}: {e}")
+        return False
+
+    # Batch the numeric conversion through NumPy: tolist() on a float
+    # array emits native Python floats in one C pass instead of a float()
+    # call per coordinate. Rows with unexpected lengths (legacy data) are
+    # filtered out before the array is built.
+    bboxes_out = []
+    raw_bboxes = [b for b in data.get("bboxes", ()) if len(b) == 4]
+    if raw_bboxes:
+        bboxes_out = [
+            {"label": "Tooth", "xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax}
+            for xmin, ymin, xmax, ymax in np.asarray(raw_bboxes, dtype=float).tolist()
+        ]
+
+    points_out = []
+    for key, cls in (("CEJ_Points", "CEJ"), ("Apex_Points", "APEX")):
+        raw_pts = [p for p in data.get(key, ()) if len(p) == 2]
+        if raw_pts:
+            points_out.extend(
+                {"x": x, "y": y, "class": cls}
+                for x, y in np.asarray(raw_pts, dtype=float).tolist()
+            )
+
+    # Extract Bone Lines
+    bone_lines_out = []
+    # Bone annotations are in a separate folder
+    bone_json_path = bone_json_dir / f"{basename}.json"
+    if bone_json_path.exists():
+        try:
+            bone_data = _read_json(bone_json_path)
+            for line in bone_data.get("Bone_Lines", ()):
+                # line is a list of points [x, y]
+                raw_line = [p for p in line if len(p) == 2]
+                if raw_line:
+                    bone_lines_out.append(
+                        [{"x": x, "y": y} for x, y in np.asarray(raw_line, dtype=float).tolist()]
+                    )
+        except Exception as e:
+            print(f"Error reading Bone JSON {bone_json_path}: {e}")
+
+    # Sync Bone Line Endpoints to CREST points
+    # Ensure that the first and last point of every bone line exists as a CREST point
+    _sync_crest_endpoints(points_out, bone_lines_out)
+
+    output_data = {
+        "file_name": img_filename,
+        "width": width,
+        "height": height,
+        "points": points_out,
+        "bboxes": bboxes_out,
+        "bone_lines": bone_lines_out
+    }
+
+    # Save Output JSON
+    output_json_path = annotations_dir / f"{basename}.json"
+    output_json_path.write_bytes(_dumps(output_data))
+
+    return True
+
 
 def main():
     """
@@ -17,6 +232,7 @@ def main():
     data_type = "Training"
     source_json_dir = project_root / f"../Raw Dataset/{data_type}/Key Points Annotations"
     source_img_dir = project_root / f"../Raw Dataset/{data_type}/Images"
+    bone_json_dir = project_root / f"../Raw Dataset/{data_type}/Bone Level Annotations"
 
     # Destination directories
     output_dir = project_root / "../Manual Annotation Data"
@@ -33,148 +249,22 @@ def main():
     json_files = list(source_json_dir.glob("*.json"))
     print(f"Found {len(json_files)} JSON files to process.")
 
+    # Each file is independent (copy + header read + two JSON loads + one
+    # dump), so fan the batch out across workers instead of pinning one core.
+    worker = partial(
+        convert_one,
+        source_img_dir=source_img_dir,
+        bone_json_dir=bone_json_dir,
+        output_dir=output_dir,
+        annotations_dir=annotations_dir,
+    )
     count = 0
-    for input_json_path in json_files:
-        basename = input_json_path.stem
-
-        # Find corresponding image
-        input_img_path = source_img_dir / f"{basename}.jpg"
-        if not input_img_path.exists():
-            # Try other extensions
-            found = False
-            for ext in ['.png', '.jpeg', '.bmp', '.tif', '.tiff']:
-                potential = source_img_dir / f"{basename}{ext}"
-                if potential.exists():
-                    input_img_path = potential
-                    found = True
-                    break
-            if not found:
-                print(f"Warning: Image for {basename} not found. Skipping.")
-                continue
-
-        img_filename = input_img_path.name
-
-        # Copy Image
-        dest_img_path = output_dir / img_filename
-        shutil.copy(input_img_path, dest_img_path)
-
-        # Get Image Dimensions
-        try:
-            with Image.open(input_img_path) as img:
-                width, height = img.size
-        except Exception as e:
-            print(f"Error opening image {input_img_path}: {e}")
-            continue
-
-        # Read Input JSON
-        try:
-            with open(input_json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except Exception as e:
-            print(f"Error reading JSON {input_json_path}: {e}")
-            continue
-
-        bboxes_out = []
-
-        if "bboxes" in data:
-            for bbox in data["bboxes"]:
-                if len(bbox) == 4:
-                    xmin, ymin, xmax, ymax = bbox
-                    bboxes_out.append({
-                        "label": "Tooth",
-                        "xmin": float(xmin),
-                        "ymin": float(ymin),
-                        "xmax": float(xmax),
-                        "ymax": float(ymax)
-                    })
-                else:
-                    # Some files might have different formats or legacy data
-                    pass
-
-        points_out = []
-        
-        # Extract CEJ Points
-        if "CEJ_Points" in data:
-            for pt in data["CEJ_Points"]:
-                if len(pt) == 2:
-                    points_out.append({
-                        "x": float(pt[0]),
-                        "y": float(pt[1]),
-                        "class": "CEJ"
-                    })
-
-        # Extract Apex Points
-        if "Apex_Points" in data:
-            for pt in data["Apex_Points"]:
-                if len(pt) == 2:
-                    points_out.append({
-                        "x": float(pt[0]),
-                        "y": float(pt[1]),
-                        "class": "APEX"
-                    })
-
-        # Extract Bone Lines
-        bone_lines_out = []
-        # Bone annotations are in a separate folder
-        bone_json_path = project_root / f"../Raw Dataset/{data_type}/Bone Level Annotations" / f"{basename}.json"
-        if bone_json_path.exists():
-            try:
-                with open(bone_json_path, 'r', encoding='utf-8') as f:
-                    bone_data = json.load(f)
-                if "Bone_Lines" in bone_data:
-                    for line in bone_data["Bone_Lines"]:
-                        # line is a list of points [x, y]
-                        converted_line = []
-                        for pt in line:
-                            if len(pt) == 2:
-                                converted_line.append({"x": float(pt[0]), "y": float(pt[1])})
-                        if converted_line:
-                            bone_lines_out.append(converted_line)
-            except Exception as e:
-                print(f"Error reading Bone JSON {bone_json_path}: {e}")
-
-        # Sync Bone Line Endpoints to CREST points
-        # Ensure that the first and last point of every bone line exists as a CREST point
-        for line in bone_lines_out:
-            if not line:
-                continue
-            
-            endpoints = [line[0], line[-1]]
-            for pt in endpoints:
-                # Check if this point exists in points_out as CREST
-                exists = False
-                for existing_pt in points_out:
-                    if existing_pt["class"] == "CREST":
-                        # Euclidean distance check (tolerance 2.0 pixels)
-                        dist = ((existing_pt["x"] - pt["x"])**2 + (existing_pt["y"] - pt["y"])**2)**0.5
-                        if dist < 2.0:
-                            exists = True
-                            break
-                
-                if not exists:
-                    points_out.append({
-                        "x": pt["x"],
-                        "y": pt["y"],
-                        "class": "CREST"
-                    })
-
-        output_data = {
-            "file_name": img_filename,
-            "width": width,
-            "height": height,
-            "points": points_out, 
-            "bboxes": bboxes_out,
-            "bone_lines": bone_lines_out
-        }
-
-        # Save Output JSON
-        output_json_path = annotations_dir / f"{basename}.json"
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
-
-        count += 1
-        if count % 10 == 0:
-            print(f"Processed {count} files...", end='\r')
+    with ProcessPoolExecutor() as ex:
+        for ok in ex.map(worker, json_files, chunksize=16):
+            if ok:
+                count += 1
+                if count % 10 == 0:
+                    print(f"Processed {count} files...", end='\r')
 
     print(f"\nBatch conversion completed. Processed {count} files.")
 